@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# businessdate
+# ------------
+# Python library for generating business dates for fast date operations
+# and rich functionality.
+#
+# Author:   sonntagsgesicht, based on a fork of Deutsche Postbank [pbrisk]
+# Version:  0.5, copyright Wednesday, 18 September 2019
+# Website:  https://github.com/sonntagsgesicht/businessdate
+# License:  Apache License 2.0 (see LICENSE file)
+
+
+""" compares memory and throughput of :class:`BusinessPeriod`
+with a period class having a per-instance `__dict__`, no interning and a hash by `repr`
+
+run by `python benchmarks/business_period.py`
+"""
+
+import sys
+import tracemalloc
+from timeit import repeat
+
+sys.path.append('.')
+sys.path.append('..')
+
+from businessdate import BusinessPeriod
+
+
+# --- reference implementation ------------------------------------------------
+
+class DictPeriod(BusinessPeriod):
+    # subclasses are neither slotted nor interned
+
+    def __hash__(self):
+        return hash(repr(self))
+
+
+# --- benchmark ---------------------------------------------------------------
+
+TENORS = '1D', '1W', '2W', '1M', '2M', '3M', '6M', '9M', '1Y', '18M', '2Y', '3Y', '5Y', '7Y', '10Y', '20Y', '30Y'
+
+
+def _rate(func, args, number=3):
+    seconds = min(repeat(lambda: [func(*a) for a in args], number=1, repeat=number))
+    return len(args) / seconds
+
+
+def _memory(cls, tenors):
+    tracemalloc.start()
+    periods = [cls(t) for t in tenors]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del periods
+    return size / len(tenors)
+
+
+def main(n=100000):
+    tenors = [TENORS[i % len(TENORS)] for i in range(n)]
+    dict_curve = dict((DictPeriod(t), i) for i, t in enumerate(TENORS))
+    slot_curve = dict((BusinessPeriod(t), i) for i, t in enumerate(TENORS))
+    dict_keys = [(DictPeriod(t),) for t in tenors]
+    slot_keys = [(BusinessPeriod(t),) for t in tenors]
+    args = [(t,) for t in tenors]
+
+    print('business periods (%d tenors)' % n)
+    print('')
+    print('  %-22s %14s %14s %8s' % ('', '__dict__', '__slots__', 'speedup'))
+    b, a = _rate(DictPeriod, args), _rate(BusinessPeriod, args)
+    print('  %-22s %14.0f %14.0f %7.1fx' % ('construction per sec', b, a, a / b))
+    b, a = _rate(hash, dict_keys), _rate(hash, slot_keys)
+    print('  %-22s %14.0f %14.0f %7.1fx' % ('hash per sec', b, a, a / b))
+    b, a = _rate(dict_curve.__getitem__, dict_keys), _rate(slot_curve.__getitem__, slot_keys)
+    print('  %-22s %14.0f %14.0f %7.1fx' % ('pillar lookup per sec', b, a, a / b))
+    b, a = _memory(DictPeriod, tenors), _memory(BusinessPeriod, tenors)
+    print('  %-22s %14.1f %14.1f %7.1fx' % ('bytes per period', b, a, b / a))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# businessdate
+# ------------
+# Python library for generating business dates for fast date operations
+# and rich functionality.
+#
+# Author:   sonntagsgesicht, based on a fork of Deutsche Postbank [pbrisk]
+# Version:  0.5, copyright Wednesday, 18 September 2019
+# Website:  https://github.com/sonntagsgesicht/businessdate
+# License:  Apache License 2.0 (see LICENSE file)
+
+
+""" compares schedules per second of swap leg cash flow building
+by the list based :class:`BusinessSchedule` path and :class:`CashFlowSchedule`
+
+run by `python benchmarks/cash_flow_schedule.py`
+"""
+
+import sys
+from timeit import repeat
+
+sys.path.append('.')
+sys.path.append('..')
+
+from businessdate import BusinessDate, BusinessSchedule, CashFlowSchedule
+
+
+# --- list based implementation -----------------------------------------------
+
+def list_cash_flows(start, end, step, convention, day_count, holidays, payment_lag):
+    schedule = BusinessSchedule(start, end, step)
+    adjusted = [d.adjust(convention, holidays) for d in schedule]
+    rows = list()
+    for s, e in zip(adjusted[:-1], adjusted[1:]):
+        rows.append((s, e, e.add_period('%dB' % payment_lag, holidays), s.get_day_count(e, day_count)))
+    return rows
+
+
+def columnar_cash_flows(start, end, step, convention, day_count, holidays, payment_lag):
+    return CashFlowSchedule(start, end, step, convention=convention, day_count=day_count,
+                            holidays=holidays, payment_lag=payment_lag)
+
+
+# --- benchmark ---------------------------------------------------------------
+
+def _rate(func, args, number=3):
+    seconds = min(repeat(lambda: [func(*a) for a in args], number=1, repeat=number))
+    return len(args) / seconds
+
+
+def main(n=200):
+    holidays = BusinessDate.DEFAULT_HOLIDAYS
+    start = BusinessDate(20200115)
+    legs = list()
+    for i in range(n):
+        s = start + '%dD' % i
+        for step, years in (('3M', 10), ('6M', 30), ('1M', 5), ('1W', 2)):
+            legs.append((s, s + '%dY' % years, step, 'mod_follow', 'act_360', holidays, 2))
+
+    print('swap legs per second (%d legs)' % len(legs))
+    print('')
+    print('  %-22s %14s %14s %8s' % ('', 'list', 'columnar', 'speedup'))
+    b, a = _rate(list_cash_flows, legs), _rate(columnar_cash_flows, legs)
+    print('  %-22s %14.0f %14.0f %7.1fx' % ('cash flow schedule', b, a, a / b))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+# businessdate
+# ------------
+# Python library for generating business dates for fast date operations
+# and rich functionality.
+#
+# Author:   sonntagsgesicht, based on a fork of Deutsche Postbank [pbrisk]
+# Version:  0.5, copyright Wednesday, 18 September 2019
+# Website:  https://github.com/sonntagsgesicht/businessdate
+# License:  Apache License 2.0 (see LICENSE file)
+
+
+""" compares memory per instance and construction per second of the date base classes
+and the :class:`BusinessDate` and :class:`OrdinalBusinessDate` on a portfolio of dates
+
+run by `python benchmarks/date_backends.py`
+"""
+
+import sys
+import tracemalloc
+from datetime import date
+from timeit import repeat
+
+sys.path.append('.')
+sys.path.append('..')
+
+from businessdate import BusinessDate, OrdinalBusinessDate
+from businessdate.basedate import BaseDateFloat, BaseDateDatetimeDate, BaseDateOrdinal
+
+
+BACKENDS = (
+    ('datetime.date', date.fromordinal),
+    ('BaseDateFloat', lambda o: BaseDateFloat(o - 693594)),
+    ('BaseDateDatetimeDate', BaseDateDatetimeDate.fromordinal),
+    ('BaseDateOrdinal', BaseDateOrdinal.from_ordinal),
+    ('BusinessDate', BusinessDate.fromordinal),
+    ('OrdinalBusinessDate', OrdinalBusinessDate.from_ordinal),
+)
+
+
+# --- benchmark ---------------------------------------------------------------
+
+def _rate(func, args, number=3):
+    seconds = min(repeat(lambda: [func(a) for a in args], number=1, repeat=number))
+    return len(args) / seconds
+
+
+def _memory(func, args):
+    tracemalloc.start()
+    dates = [func(a) for a in args]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # do not count the list holding the dates
+    return (size - sys.getsizeof(dates)) / len(args)
+
+
+def main(n=1000000):
+    # cash flow dates of a portfolio spread over 40 years
+    first = date(2020, 1, 1).toordinal()
+    ordinals = [first + (i * 7919) % 14610 for i in range(n)]
+
+    print('date backends (%d dates)' % n)
+    print('')
+    print('  %-22s %14s %14s' % ('', 'bytes/date', 'dates/sec'))
+    for name, func in BACKENDS:
+        print('  %-22s %14.1f %14.0f' % (name, _memory(func, ordinals), _rate(func, ordinals[:n // 10])))
+
+
+if __name__ == '__main__':
+    main()
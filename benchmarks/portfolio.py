@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+# businessdate
+# ------------
+# Python library for generating business dates for fast date operations
+# and rich functionality.
+#
+# Author:   sonntagsgesicht, based on a fork of Deutsche Postbank [pbrisk]
+# Version:  0.5, copyright Wednesday, 18 September 2019
+# Website:  https://github.com/sonntagsgesicht/businessdate
+# License:  Apache License 2.0 (see LICENSE file)
+
+
+""" macro benchmark building the cash flow dates of a synthetic portfolio of trades
+
+Trades are generated by :func:`generate_trades` with random (but reproducible by `--seed`)
+trade dates, tenors, frequencies, rolls, business day and day count conventions and calendars.
+Each trade runs through the public api, i.e.
+
+    * **schedule** building the unadjusted dates by :class:`BusinessSchedule`,
+    * **adjust** adjusting the dates by :meth:`BusinessDate.adjust`,
+    * **year fraction** calculating year fractions of the periods by :meth:`BusinessDate.get_year_fraction`.
+
+Reports wall time of each stage, total wall time and peak resident memory.
+
+run by `python benchmarks/portfolio.py`
+
+options are
+
+    * `--trades N` number of trades (default: 10000),
+    * `--seed N` seed of the random trade generator (default: 0),
+    * `--save FILE` to store results as json.
+"""
+
+import json
+import platform
+import sys
+from argparse import ArgumentParser
+from calendar import MONDAY, THURSDAY
+from datetime import date, datetime
+from random import Random
+from timeit import default_timer
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+sys.path.append('.')
+sys.path.append('..')
+
+from businessdate import BusinessDate, BusinessSchedule
+from businessdate.businessholidays import TargetHolidays, RuleBasedHolidays, JointCalendar
+from businessdate.holidayrules import FixedHoliday, WeekdayHoliday, nearest_weekday
+
+
+# --- workload generator ------------------------------------------------------
+
+class NewYorkHolidays(RuleBasedHolidays):
+    # federal holidays as a second calendar besides target
+    RULES = (
+        FixedHoliday(1, 1, "New Year's Day", nearest_weekday),
+        WeekdayHoliday(1, MONDAY, 3, "Martin Luther King Jr. Day"),
+        WeekdayHoliday(2, MONDAY, 3, "Presidents' Day"),
+        WeekdayHoliday(5, MONDAY, -1, "Memorial Day"),
+        FixedHoliday(7, 4, "Independence Day", nearest_weekday),
+        WeekdayHoliday(9, MONDAY, 1, "Labor Day"),
+        WeekdayHoliday(10, MONDAY, 2, "Columbus Day"),
+        FixedHoliday(11, 11, "Veterans Day", nearest_weekday),
+        WeekdayHoliday(11, THURSDAY, 4, "Thanksgiving Day"),
+        FixedHoliday(12, 25, "Christmas Day", nearest_weekday),
+    )
+
+
+def calendars():
+    """ returns :class:`dict` of calendars used by trades """
+    target, new_york = TargetHolidays(), NewYorkHolidays()
+    return {
+        'target': target,
+        'new_york': new_york,
+        'target+new_york': JointCalendar((target, new_york)),
+    }
+
+
+TENORS = '1Y', '2Y', '3Y', '5Y', '7Y', '10Y', '15Y', '20Y', '30Y'
+FREQUENCIES = '1M', '3M', '3M', '6M', '6M', '1Y'
+CONVENTIONS = 'mod_follow', 'mod_follow', 'follow', 'previous'
+DAY_COUNTS = 'act_360', 'act_365', '30_360', 'act_act'
+CALENDARS = 'target', 'target', 'new_york', 'target+new_york'
+
+
+def generate_trades(n, seed=0):
+    """ returns :class:`list` of `n` trades as :class:`dict`
+
+    Each trade has a `start` and `end` date, a `step`, a `roll` date (either start or end),
+    a business day `convention`, a `day_count` and a `calendar` name (see :func:`calendars`).
+    """
+    rnd = Random(seed)
+    first = date(2020, 1, 1).toordinal()
+    trades = list()
+    for _ in range(n):
+        start = BusinessDate(date.fromordinal(first + rnd.randrange(3 * 365)))
+        end = start + rnd.choice(TENORS)
+        trades.append(dict(
+            start=start,
+            end=end,
+            step=rnd.choice(FREQUENCIES),
+            roll=rnd.choice((start, end)),
+            convention=rnd.choice(CONVENTIONS),
+            day_count=rnd.choice(DAY_COUNTS),
+            calendar=rnd.choice(CALENDARS)))
+    return trades
+
+
+# --- benchmark ---------------------------------------------------------------
+
+def _peak_rss():
+    # peak resident set size in MB (ru_maxrss is given in bytes on macOS and in KB elsewhere)
+    if resource is None:
+        return float('nan')
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024. ** 2 if sys.platform == 'darwin' else rss / 1024.
+
+
+def run(trades, holidays):
+    """ runs stages on trades and returns :class:`dict` of results """
+    timer = default_timer
+    t0 = timer()
+    schedules = [BusinessSchedule(t['start'], t['end'], t['step'], t['roll']) for t in trades]
+    t1 = timer()
+    adjusted = list()
+    for t, schedule in zip(trades, schedules):
+        convention, calendar = t['convention'], holidays[t['calendar']]
+        adjusted.append([d.adjust(convention, calendar) for d in schedule])
+    t2 = timer()
+    year_fractions = list()
+    for t, dates in zip(trades, adjusted):
+        day_count = t['day_count']
+        year_fractions.append([s.get_year_fraction(e, day_count) for s, e in zip(dates[:-1], dates[1:])])
+    t3 = timer()
+
+    periods = sum(len(y) for y in year_fractions)
+    return dict(
+        trades=len(trades),
+        dates=sum(len(s) for s in schedules),
+        periods=periods,
+        stages={'schedule': t1 - t0, 'adjust': t2 - t1, 'year fraction': t3 - t2},
+        wall_time=t3 - t0,
+        peak_rss_mb=_peak_rss())
+
+
+def main(argv=None):
+    parser = ArgumentParser(description='portfolio macro benchmark of businessdate')
+    parser.add_argument('--trades', type=int, default=10000, help='number of trades (default: 10000)')
+    parser.add_argument('--seed', type=int, default=0, help='seed of trade generator (default: 0)')
+    parser.add_argument('--save', help='file to store results as json')
+    args = parser.parse_args(argv)
+
+    trades = generate_trades(args.trades, args.seed)
+    result = run(trades, calendars())
+
+    print('portfolio of %d trades with %d dates and %d periods' % (result['trades'], result['dates'], result['periods']))
+    print('')
+    print('  %-22s %14s %14s %8s' % ('stage', 'seconds', 'dates/sec', 'share'))
+    for stage, seconds in result['stages'].items():
+        print('  %-22s %14.3f %14.0f %7.1f%%' %
+              (stage, seconds, result['dates'] / seconds, 100. * seconds / result['wall_time']))
+    print('  %-22s %14.3f %14.0f' % ('total', result['wall_time'], result['dates'] / result['wall_time']))
+    print('')
+    print('  peak resident memory %.1f MB' % result['peak_rss_mb'])
+
+    if args.save:
+        result.update(
+            date=datetime.now().isoformat(),
+            python=platform.python_version(),
+            platform=platform.platform(),
+            seed=args.seed)
+        with open(args.save, 'w') as f:
+            json.dump(result, f, indent=2, sort_keys=True)
+        print('')
+        print('results saved to %s' % args.save)
+
+
+if __name__ == '__main__':
+    main()
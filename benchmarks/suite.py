@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+
+# businessdate
+# ------------
+# Python library for generating business dates for fast date operations
+# and rich functionality.
+#
+# Author:   sonntagsgesicht, based on a fork of Deutsche Postbank [pbrisk]
+# Version:  0.5, copyright Wednesday, 18 September 2019
+# Website:  https://github.com/sonntagsgesicht/businessdate
+# License:  Apache License 2.0 (see LICENSE file)
+
+
+""" micro benchmarks of the core date, period and calendar operations
+
+Reports operations per second (and bytes per object for constructions)
+of :class:`BusinessDate` construction, :meth:`BusinessDate.add_period`, :meth:`BusinessDate.adjust`,
+:meth:`BusinessDate.get_day_count`, :class:`BusinessRange`, :class:`BusinessSchedule`
+and holiday lookups on calendars of ten years.
+
+run by `python benchmarks/suite.py`
+
+options are
+
+    * `--save FILE` to store results as json, e.g. as baseline,
+    * `--baseline FILE` to compare against stored results
+      (exits with status 1 if a benchmark is slower than the baseline by more than `--tolerance`),
+    * `--tolerance X` relative slow down accepted by `--baseline` (default: 0.1),
+    * `--scale X` to scale the sizes of all benchmarks, e.g. 0.1 for a quick run (default: 1.0),
+    * `--filter STR` to run only benchmarks which names contain STR,
+    * `--rounds N` number of rounds, each run in a fresh process (default: 5).
+
+Each benchmark runs once to warm up and then is timed by :meth:`timeit.Timer.autorange`,
+i.e. with as many calls as take at least 0.2 seconds, taking the best of `REPEAT` such timings.
+Default calendars are generated and indexed in advance.
+
+Since speed varies from process to process (and by the load of the machine)
+all benchmarks are timed once per round in a fresh process and the best round is reported
+together with the **noise**, i.e. the relative distance of the worst to the best round.
+A comparison with a baseline accepts slow downs up to `--tolerance` plus the noise
+of the baseline or current run, whichever is larger,
+so noisy machines do not report regressions of identical code.
+"""
+
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from argparse import ArgumentParser, SUPPRESS
+from datetime import date, datetime
+from subprocess import check_output
+from timeit import Timer
+
+sys.path.append('.')
+sys.path.append('..')
+
+from businessdate import BusinessDate, OrdinalBusinessDate, BusinessPeriod, BusinessRange, BusinessSchedule, \
+    BusinessHolidays
+from businessdate.businessholidays import TargetHolidays
+
+
+CASES = list()
+REPEAT = 3
+ROUNDS = 5
+
+
+def case(name):
+    """ registers a benchmark function `func(scale)`
+    returning `(run, ops)` or `(run, ops, factory, args)` to measure memory of `[factory(a) for a in args]` """
+    def register(func):
+        CASES.append((name, func))
+        return func
+    return register
+
+
+def _size(n, scale):
+    return max(1, int(n * scale))
+
+
+def _daily(years, scale=1.0):
+    # daily ordinals of years starting 2020
+    first = date(2020, 1, 1).toordinal()
+    return list(range(first, first + _size(365 * years, scale)))
+
+
+# --- date construction -------------------------------------------------------
+
+@case('BusinessDate(int) 1M')
+def _construct_int(scale):
+    ints = [int(date.fromordinal(o).strftime('%Y%m%d')) for o in _daily(40)]
+    ints = [ints[i % len(ints)] for i in range(_size(1000000, scale))]
+    return (lambda: [BusinessDate(i) for i in ints]), len(ints), BusinessDate, ints
+
+
+@case('BusinessDate(iso str) 1M')
+def _construct_iso(scale):
+    strs = [date.fromordinal(o).isoformat() for o in _daily(40)]
+    strs = [strs[i % len(strs)] for i in range(_size(1000000, scale))]
+    return (lambda: [BusinessDate(s) for s in strs]), len(strs)
+
+
+@case('OrdinalBusinessDate(int) 1M')
+def _construct_ordinal(scale):
+    ints = [int(date.fromordinal(o).strftime('%Y%m%d')) for o in _daily(40)]
+    ints = [ints[i % len(ints)] for i in range(_size(1000000, scale))]
+    return (lambda: [OrdinalBusinessDate(i) for i in ints]), len(ints), OrdinalBusinessDate, ints
+
+
+@case('BusinessPeriod(str)')
+def _construct_period(scale):
+    tenors = ['%d%s' % (i, u) for u in 'DWMY' for i in range(1, 31)]
+    tenors = [tenors[i % len(tenors)] for i in range(_size(100000, scale))]
+    return (lambda: [BusinessPeriod(t) for t in tenors]), len(tenors), BusinessPeriod, tenors
+
+
+# --- date calculations -------------------------------------------------------
+
+def _dates(scale):
+    return BusinessDate.from_ordinals(_daily(10, scale))
+
+
+@case('add_period 3M')
+def _add_months(scale):
+    dates, period = _dates(scale), BusinessPeriod('3M')
+    return (lambda: [d.add_period(period) for d in dates]), len(dates)
+
+
+@case('add_period 2B')
+def _add_business_days(scale):
+    dates, period = _dates(scale), BusinessPeriod('2B')
+    return (lambda: [d.add_period(period) for d in dates]), len(dates)
+
+
+@case('adjust mod_follow')
+def _adjust(scale):
+    dates = _dates(scale)
+    return (lambda: [d.adjust('mod_follow') for d in dates]), len(dates)
+
+
+@case('get_day_count act_act')
+def _day_count(scale):
+    dates = _dates(scale)
+    end = dates[-1]
+    return (lambda: [d.get_day_count(end, 'act_act') for d in dates]), len(dates)
+
+
+# --- ranges and schedules ----------------------------------------------------
+
+@case('BusinessRange 30Y daily')
+def _range(scale):
+    start = BusinessDate(20200101)
+    end = start + '%dD' % _size(365 * 30, scale)
+    return (lambda: BusinessRange(start, end, '1D')), 1
+
+
+@case('BusinessSchedule 30Y 3M')
+def _schedule(scale):
+    starts = BusinessDate.from_ordinals(_daily(1, scale / 10.))
+    return (lambda: [BusinessSchedule(s, s + '30Y', '3M') for s in starts]), len(starts)
+
+
+# --- holidays ----------------------------------------------------------------
+
+def _ten_year_calendar():
+    target = TargetHolidays()
+    return BusinessHolidays(d for d in target.warm(2020, 2029) if 2020 <= d.year <= 2029)
+
+
+@case('BusinessHolidays in 10Y')
+def _contains(scale):
+    holidays, dates = _ten_year_calendar(), _dates(scale)
+    return (lambda: [d in holidays for d in dates]), len(dates)
+
+
+@case('TargetHolidays in 10Y')
+def _target_contains(scale):
+    holidays, dates = TargetHolidays().warm(2020, 2029), _dates(scale)
+    return (lambda: [d in holidays for d in dates]), len(dates)
+
+
+# --- benchmark ---------------------------------------------------------------
+
+def _warm_up():
+    # generate holidays and build business day index of the default calendar before any timing
+    holidays = BusinessDate.DEFAULT_HOLIDAYS
+    holidays.warm(2015, 2065)
+    holidays.business_day_index()
+
+
+def _rate(func, ops, repeat=REPEAT):
+    func()
+    timer = Timer(func)
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+    return ops / seconds
+
+
+def _memory(factory, args):
+    tracemalloc.start()
+    objects = [factory(a) for a in args]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # do not count the list holding the objects
+    return (size - sys.getsizeof(objects)) / len(args)
+
+
+def run(scale=1.0, pattern=''):
+    """ runs a single round of benchmarks which names contain `pattern` and returns :class:`dict` of ops per second """
+    _warm_up()
+    rates = dict()
+    for name, func in CASES:
+        if pattern in name:
+            rates[name] = _rate(*func(scale)[:2])
+    return rates
+
+
+def run_rounds(scale=1.0, pattern='', rounds=ROUNDS):
+    """ runs `rounds` of benchmarks in fresh processes and returns :class:`list` of `(name, result)` """
+    argv = [sys.executable, os.path.abspath(__file__), '--worker', '--scale', str(scale), '--filter', pattern]
+    samples = [json.loads(check_output(argv).decode()) for _ in range(rounds)]
+    results = list()
+    for name, func in CASES:
+        if pattern not in name:
+            continue
+        rates = [sample[name] for sample in samples]
+        result = dict(ops_per_sec=max(rates), noise=1. - min(rates) / max(rates))
+        bench = func(scale)
+        if len(bench) > 2:
+            result['bytes_per_object'] = _memory(*bench[2:])
+        results.append((name, result))
+    return results
+
+
+def compare(results, baseline, tolerance=0.1):
+    """ returns :class:`list` of names of benchmarks slower than baseline by more than `tolerance` plus noise """
+    slower = list()
+    print('  %-30s %14s %14s %8s %8s' % ('ops/sec', 'baseline', 'current', 'ratio', 'noise'))
+    for name, result in results:
+        if name not in baseline:
+            continue
+        b, a = baseline[name]['ops_per_sec'], result['ops_per_sec']
+        noise = max(baseline[name].get('noise', 0.), result.get('noise', 0.))
+        flag = ''
+        if a < b * (1. - tolerance - noise):
+            slower.append(name)
+            flag = ' slower'
+        print('  %-30s %14.0f %14.0f %7.2fx %7.0f%%%s' % (name, b, a, a / b, 100. * noise, flag))
+    return slower
+
+
+def main(argv=None):
+    parser = ArgumentParser(description='micro benchmarks of businessdate')
+    parser.add_argument('--save', help='file to store results as json')
+    parser.add_argument('--baseline', help='json file of results to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='relative slow down accepted (default: 0.1)')
+    parser.add_argument('--scale', type=float, default=1.0, help='scale of benchmark sizes (default: 1.0)')
+    parser.add_argument('--filter', default='', help='run only benchmarks which names contain FILTER')
+    parser.add_argument('--rounds', type=int, default=ROUNDS, help='number of rounds (default: %d)' % ROUNDS)
+    parser.add_argument('--worker', action='store_true', help=SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run(args.scale, args.filter)))
+        return 0
+
+    print('businessdate micro benchmarks (scale %s, %d rounds)' % (args.scale, args.rounds))
+    print('')
+    print('  %-30s %14s %8s %14s' % ('', 'ops/sec', 'noise', 'bytes/object'))
+    results = run_rounds(args.scale, args.filter, args.rounds)
+    for name, result in results:
+        line = '  %-30s %14.0f %7.0f%%' % (name, result['ops_per_sec'], 100. * result['noise'])
+        if 'bytes_per_object' in result:
+            line += ' %14.1f' % result['bytes_per_object']
+        print(line)
+
+    if args.save:
+        report = dict(
+            date=datetime.now().isoformat(),
+            python=platform.python_version(),
+            platform=platform.platform(),
+            scale=args.scale,
+            rounds=args.rounds,
+            results=dict(results))
+        with open(args.save, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print('')
+        print('results saved to %s' % args.save)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print('')
+        if not baseline.get('scale') == args.scale:
+            print('  note: baseline has been run with scale %s' % baseline.get('scale'))
+        slower = compare(results, baseline['results'], args.tolerance)
+        if slower:
+            print('')
+            print('slower than baseline: %s' % ', '.join(slower))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
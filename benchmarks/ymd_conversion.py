@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# businessdate
+# ------------
+# Python library for generating business dates for fast date operations
+# and rich functionality.
+#
+# Author:   sonntagsgesicht, based on a fork of Deutsche Postbank [pbrisk]
+# Version:  0.5, copyright Wednesday, 18 September 2019
+# Website:  https://github.com/sonntagsgesicht/businessdate
+# License:  Apache License 2.0 (see LICENSE file)
+
+
+""" compares conversions per second of excel <> (year, month, day)
+between the former loop based and the closed form implementation in :mod:`businessdate.ymd`
+
+run by `python benchmarks/ymd_conversion.py`
+"""
+
+import sys
+from math import floor
+from timeit import repeat
+
+sys.path.append('.')
+sys.path.append('..')
+
+from businessdate import ymd
+from businessdate.ymd import _cum_month_days, days_in_year, is_leap_year, is_valid_ymd
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# --- former implementation ---------------------------------------------------
+
+def loop_from_excel_to_ymd(excel_int):
+    int_date = int(floor(excel_int))
+    int_date -= 1 if excel_int > 60 else 0
+
+    year = (int_date - 1) // 365
+    rest_days = int_date - 365 * year - (year + 3) // 4 + (year + 99) // 100 - (year + 299) // 400
+    year += 1900
+
+    while rest_days <= 0:
+        year -= 1
+        rest_days += days_in_year(year)
+
+    month = 1
+    if is_leap_year(year) and rest_days == 60:
+        month = 2
+        day = 29
+    else:
+        if is_leap_year(year) and rest_days > 60:
+            rest_days -= 1
+
+        while rest_days > _cum_month_days[month]:
+            month += 1
+
+        day = rest_days - _cum_month_days[month - 1]
+    return year, month, day
+
+
+def loop_from_ymd_to_excel(year, month, day):
+    if not is_valid_ymd(year, month, day):
+        raise ValueError("Invalid date {0}.{1}.{2}".format(year, month, day))
+
+    days = _cum_month_days[month - 1] + day
+    days += 1 if (is_leap_year(year) and month > 2) else 0
+
+    years_distance = year - 1900
+    days += \
+        years_distance * 365 + (years_distance + 3) // 4 - (years_distance + 99) // 100 + (years_distance + 299) // 400
+
+    days += 1 if (year, month, day) > (1900, 2, 28) else 0
+    return days
+
+
+# --- benchmark ---------------------------------------------------------------
+
+def _rate(func, args, number=3):
+    seconds = min(repeat(lambda: [func(*a) for a in args], number=1, repeat=number))
+    return len(args) / seconds
+
+
+def main(n=200000):
+    excel = [(e,) for e in range(1, 1 + 36 * n // 100 * 100, 36 * n // 100 * 100 // n or 1)][:n]
+    dates = [ymd.from_excel_to_ymd(*e) for e in excel]
+
+    print('conversions per second (%d dates)' % len(excel))
+    print('')
+    print('  %-22s %14s %14s %8s' % ('', 'loop', 'closed form', 'speedup'))
+    for name, before, after, args in (
+            ('from_excel_to_ymd', loop_from_excel_to_ymd, ymd.from_excel_to_ymd, excel),
+            ('from_ymd_to_excel', loop_from_ymd_to_excel, ymd.from_ymd_to_excel, dates)):
+        b, a = _rate(before, args), _rate(after, args)
+        print('  %-22s %14.0f %14.0f %7.1fx' % (name, b, a, a / b))
+
+    if np is not None:
+        array = np.array([e for e, in excel])
+        seconds = min(repeat(lambda: ymd.from_excel_to_ymd_array(array), number=1, repeat=3))
+        print('  %-22s %14s %14.0f' % ('from_excel_to_ymd_array', '', len(array) / seconds))
+        y, m, d = ymd.from_excel_to_ymd_array(array)
+        seconds = min(repeat(lambda: ymd.from_ymd_to_excel_array(y, m, d), number=1, repeat=3))
+        print('  %-22s %14s %14.0f' % ('from_ymd_to_excel_array', '', len(array) / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -29,6 +29,9 @@ logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 from .businessholidays import BusinessHolidays
 from .businessperiod import BusinessPeriod
-from .businessdate import BusinessDate
-from .businessrange import BusinessRange
-from .businessschedule import BusinessSchedule
+from .businessdate import BusinessDate, OrdinalBusinessDate
+from .businessrange import BusinessRange, LazyBusinessRange
+from .businessschedule import BusinessSchedule, CashFlowSchedule
+from .businessdatearray import BusinessDateArray
+from .dateexpression import DateExpression
+from .instrumentation import stats
@@ -19,6 +19,8 @@ from .ymd import from_excel_to_ymd, from_ymd_to_excel
 class BaseDateFloat(float):
     """ native :class:`float` backed base class for a performing date calculations counting days since Jan, 1st 1900 """
 
+    __slots__ = '_ymd',
+
     def __new__(cls, x=0):
         new = super(BaseDateFloat, cls).__new__(cls, x)
         new._ymd = None
@@ -85,7 +87,6 @@ class BaseDateFloat(float):
     # --- calculation methods ------------------------------------------------
 
     def _add_days(self, n):
-        self._ymd = None
         return self.__class__(super(BaseDateFloat, self).__add__(n))
 
     def _diff_in_days(self, d):
@@ -140,3 +141,106 @@ class BaseDateDatetimeDate(date):
     def _diff_in_days(self, end):
         delta = super(BaseDateDatetimeDate, end).__sub__(self)
         return float(delta.days)
+
+
+class BaseDateOrdinal(int):
+    """ immutable :class:`int` backed base class for a performing date calculations
+    counting days as proleptic Gregorian ordinal (see :meth:`datetime.date.toordinal`)
+
+    Instances carry neither a :code:`__dict__` nor any further fields.
+    Their `(year, month, day)` tuples are cached in :code:`BaseDateOrdinal.YMD_CACHE`
+    which is shared by all instances of the same date
+    and which is cleared once it holds :code:`BaseDateOrdinal.YMD_CACHE_SIZE` dates.
+    """
+
+    __slots__ = ()
+
+    YMD_CACHE = dict()
+    YMD_CACHE_SIZE = 2 ** 16
+
+    def __new__(cls, x=1):
+        return super(BaseDateOrdinal, cls).__new__(cls, x)
+
+    def __reduce__(self):
+        return _from_ordinal, (self.__class__, int(self))
+
+    # --- property methods ---------------------------------------------------
+
+    @property
+    def day(self):
+        return self.to_ymd()[2]
+
+    @property
+    def month(self):
+        return self.to_ymd()[1]
+
+    @property
+    def year(self):
+        return self.to_ymd()[0]
+
+    def weekday(self):
+        return (int(self) + 6) % 7
+
+    def toordinal(self):
+        return int(self)
+
+    # --- constructor method -------------------------------------------------
+
+    @classmethod
+    def from_ordinal(cls, ordinal):
+        """ creates instance from proleptic Gregorian ordinal `ordinal` (see :meth:`datetime.date.toordinal`) """
+        return int.__new__(cls, ordinal)
+
+    @classmethod
+    def from_ymd(cls, year, month, day):
+        """ creates instance from a :class:`tuple` of :class:`int` items `(year, month, day)` """
+        return int.__new__(cls, date(year, month, day).toordinal())
+
+    @classmethod
+    def from_date(cls, d):
+        """ creates instance from a :class:`datetime.date` object `d` """
+        return int.__new__(cls, date(d.year, d.month, d.day).toordinal())
+
+    @classmethod
+    def from_float(cls, x):
+        """ creates from a :class:`float` `x` counting the days since Jan, 1st 1900 """
+        y, m, d = from_excel_to_ymd(x)
+        return cls.from_ymd(y, m, d)
+
+    # --- cast method --------------------------------------------------------
+
+    def to_ymd(self):
+        """ returns the :class:`tuple` of :class:`int` items `(year, month, day)` """
+        cache = BaseDateOrdinal.YMD_CACHE
+        ymd = cache.get(self)
+        if ymd is None:
+            d = date.fromordinal(self)
+            ymd = d.year, d.month, d.day
+            if len(cache) >= BaseDateOrdinal.YMD_CACHE_SIZE:
+                cache.clear()
+            cache[int(self)] = ymd
+        return ymd
+
+    def to_date(self):
+        """ returns `datetime.date(year, month, day)` """
+        return date.fromordinal(self)
+
+    def to_float(self):
+        """ returns :class:`float` counting the days since Jan, 1st 1900 """
+        return float(from_ymd_to_excel(*self.to_ymd()))
+
+    def to_serializable(self, *args, **kwargs):
+        return str(self)
+
+    # --- calculation methods ------------------------------------------------
+
+    def _add_days(self, days_int):
+        return int.__new__(self.__class__, int(self) + days_int)
+
+    def _diff_in_days(self, end):
+        return float(end.toordinal() - int(self))
+
+
+def _from_ordinal(cls, ordinal):
+    # unpickle helper of BaseDateOrdinal as cls(ordinal) may be overridden by subclasses
+    return cls.from_ordinal(ordinal)
@@ -15,18 +15,26 @@ from datetime import date, datetime, timedelta
 
 from . import conventions
 from . import daycount
+from . import instrumentation
 from .ymd import is_leap_year, days_in_year, days_in_month, end_of_quarter_month
-from .basedate import BaseDateFloat, BaseDateDatetimeDate
-from .businessholidays import TargetHolidays
+from .basedate import BaseDateFloat, BaseDateDatetimeDate, BaseDateOrdinal
+from .businessholidays import BusinessHolidays, TargetHolidays
 from .businessperiod import BusinessPeriod
+from .dateexpression import DateExpression
+from .lrucache import LRUCache
 
 
-class BusinessDate(BaseDateDatetimeDate):
+class _BusinessDate(object):
+    # business date functionality independent of the base class backing the date (see BusinessDate)
+
+    __slots__ = ()
+
     ADJUST = 'No'
     BASE_DATE = None
     DATE_FORMAT = '%Y%m%d'
     DAY_COUNT = 'act_36525'
     DEFAULT_HOLIDAYS = TargetHolidays()
+    RESULT_CACHE = LRUCache(0)
 
     _adj_func = {
         'no': conventions.adjust_no,
@@ -74,6 +82,7 @@ class BusinessDate(BaseDateDatetimeDate):
         'act_act': daycount.get_act_act,
         'actact': daycount.get_act_act,
     }
+    _shortcuts = set()
 
     def __new__(cls, year=None, month=0, day=0, convention=None, holidays=None):
         """ date class to perform calculations coming from financial businesses
@@ -102,10 +111,19 @@ class BusinessDate(BaseDateDatetimeDate):
          which is used as default for :meth:`BusinessDate.adjust`.
         '''
 
+        # fast path dispatched by exact type of most common inputs
+        kind = type(year)
+        if kind is int and not month and 10000101 <= year <= 99991231 and year // 100 % 100 <= 12:
+            return cls._from_ymd(year // 10000, year // 100 % 100, year % 100)
+        if kind is str and not month and cls._is_iso_string(year):
+            return cls._from_ymd(int(year[:4]), int(year[5:7]), int(year[8:]))
+        if kind is cls or kind is date:
+            return cls._from_ymd(year.year, year.month, year.day)
+
         if isinstance(year, str):
             year, month, day = cls._parse_date_string(year, default=(year, month, day))
 
-        if isinstance(year, (date, BaseDateFloat, BaseDateDatetimeDate, BusinessDate)):
+        if isinstance(year, (date, BaseDateFloat, BaseDateDatetimeDate, BaseDateOrdinal, _BusinessDate)):
             year, month, day = year.year, year.month, year.day
 
         if isinstance(year, (int, float)) and 10000101 <= year:  # start 20191231 representation from 1000 a.d.
@@ -116,17 +134,15 @@ class BusinessDate(BaseDateDatetimeDate):
             if 12 < month:
                 year += int(month // 12)
                 month = int(month % 12)
-            if issubclass(cls, BaseDateFloat):
-                return cls.from_ymd(year, month, day)
-            return super(BusinessDate, cls).__new__(cls, year, month, day)
+            return cls._from_ymd(year, month, day)
 
         if isinstance(year, (int, float)) and 1 < year < 10000101:  # excel representation before 1000 a.d.
-            if issubclass(cls, BaseDateDatetimeDate):
-                return cls.from_float(year)
-            return super(BusinessDate, cls).__new__(cls, year)
+            if issubclass(cls, BaseDateFloat):
+                return BaseDateFloat.__new__(cls, year)
+            return cls.from_float(year)
 
         if isinstance(year, (list, tuple)):
-            return list(map(BusinessDate, year))
+            return list(map(cls, year))
 
         if year is None:
             if cls.BASE_DATE is None:
@@ -139,6 +155,48 @@ class BusinessDate(BaseDateDatetimeDate):
         # try to split complex or period input, e.g. '0B1D2BMOD20191231' or '3Y2M1D' or '-2B'
         return cls._from_complex_input(str(year))
 
+    @classmethod
+    def _from_ymd(cls, year, month, day):
+        if issubclass(cls, BaseDateDatetimeDate):
+            return date.__new__(cls, year, month, day)
+        return cls.from_ymd(year, month, day)
+
+    @staticmethod
+    def _is_iso_string(date_str):
+        return len(date_str) == 10 and date_str[4] == date_str[7] == '-' \
+            and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()
+
+    @classmethod
+    def from_ordinals(cls, ordinals):
+        """ creates :class:`list` of instances from an iterable of proleptic Gregorian ordinals
+
+        :param ordinals: iterable of :class:`int` as given by :meth:`datetime.date.toordinal`
+        :return: :class:`list` of :class:`BusinessDate`
+        """
+        new, fromordinal = cls._from_ymd, date.fromordinal
+        res = list()
+        for ordinal in ordinals:
+            d = fromordinal(ordinal)
+            res.append(new(d.year, d.month, d.day))
+        return res
+
+    @classmethod
+    def from_iso_strings(cls, date_strs):
+        """ creates :class:`list` of instances from an iterable of strings of format `YYYY-MM-DD`
+
+        :param date_strs: iterable of :class:`str`
+         (items of other formats are passed to :class:`BusinessDate`)
+        :return: :class:`list` of :class:`BusinessDate`
+        """
+        new, is_iso = cls._from_ymd, cls._is_iso_string
+        res = list()
+        for s in date_strs:
+            if is_iso(s):
+                res.append(new(int(s[:4]), int(s[5:7]), int(s[8:])))
+            else:
+                res.append(cls(s))
+        return res
+
     @classmethod
     def _parse_date_string(cls, date_str, default=None):
         date_str = str(date_str)
@@ -162,58 +220,13 @@ class BusinessDate(BaseDateDatetimeDate):
 
     @classmethod
     def _from_complex_input(cls, date_str):
-        date_str = str(date_str).upper()
-        convention, origin, holidays = None, None, None
-
-        # first, extract origin
-        if len(date_str) > 8:
-            try:
-                datetime.strptime(date_str[-8:], '%Y%m%d')
-                origin = date_str[-8:]
-                date_str = date_str[:-8]
-            except ValueError:
-                # no date found a the end of the string
-                pass
-
-        # second, extract convention
-        for a in sorted(cls._adj_func.keys(), key=len, reverse=True):
-            if date_str.find(a.upper()) >= 0:
-                convention = a
-                date_str = date_str[:-len(a)]
-                break
-        if not date_str:
-            date_str = '0B'
-
-        # third, parse spot, period and final
-        pfields = date_str.strip('0123456789+-B')
-        spot, period, final = date_str, '', ''
-        if pfields:
-            spot, period, final = '', '', ''
-            x = pfields[-1]
-            period, final = date_str.split(x, 1)
-            period += x
-            if period.find('B') >= 0:
-                spot, period = period.split('B', 1)
-                spot += 'B'
-
-        # third, build BusinessDate and adjust by conventions to periods
-        res = cls(origin)
-        if spot:
-            if convention:
-                res = res.adjust(convention, holidays)
-            res = res.add_period(spot, holidays)
-        if period:
-            res = res.add_period(period, holidays)
-        if final:
-            if convention:
-                res = res.adjust(convention, holidays)
-            res = res.add_period(final, holidays)
-        return res
+        expr = DateExpression.parse(date_str)
+        return expr.evaluate(cls(int(expr.origin)) if expr.origin else cls())
 
     @classmethod
     def is_businessdate(cls, d):
         """ checks whether the provided input can be a date """
-        if not isinstance(d, (date, BaseDateFloat, BaseDateDatetimeDate)):
+        if not isinstance(d, (date, BaseDateFloat, BaseDateDatetimeDate, BaseDateOrdinal)):
             try:  # to be removed
                 cls(d)
             except ValueError:
@@ -224,7 +237,7 @@ class BusinessDate(BaseDateDatetimeDate):
         return self.__deepcopy__()
 
     def __deepcopy__(self, memodict={}):
-        return BusinessDate(date(*self.to_ymd()))
+        return self.__class__(date(*self.to_ymd()))
 
     # --- operator methods ---------------------------------------------------
 
@@ -252,8 +265,8 @@ class BusinessDate(BaseDateDatetimeDate):
             return [self - pd for pd in other]
         if BusinessPeriod.is_businessperiod(other):
             return self + (-1 * BusinessPeriod(other))
-        if BusinessDate.is_businessdate(other):
-            y, m, d = BusinessDate(other).diff_in_ymd(self)
+        if self.__class__.is_businessdate(other):
+            y, m, d = self.__class__(other).diff_in_ymd(self)
             return BusinessPeriod(years=y, months=m, days=d)
         raise TypeError('subtraction of BusinessDates cannot handle objects of type %s.' % other.__class__.__name__)
 
@@ -280,11 +293,11 @@ class BusinessDate(BaseDateDatetimeDate):
 
     def end_of_month(self):
         """ returns the day of the end of the month as :class:`BusinessDate` object"""
-        return BusinessDate(self.year, self.month, self.days_in_month())
+        return self.__class__(self.year, self.month, self.days_in_month())
 
     def end_of_quarter(self):
         """ returns the day of the end of the quarter as :class:`BusinessDate` object"""
-        return BusinessDate(self.year, end_of_quarter_month(self.month), 0o1).end_of_month()
+        return self.__class__(self.year, end_of_quarter_month(self.month), 0o1).end_of_month()
 
     def is_business_day(self, holidays=None):
         """ returns `True` if date falls neither on weekend nor is in holidays (if given as container object) """
@@ -296,20 +309,31 @@ class BusinessDate(BaseDateDatetimeDate):
     def _add_business_days(self, days_int, holidays=None):
         holidays = self.__class__.DEFAULT_HOLIDAYS if holidays is None else holidays
 
+        if days_int and isinstance(holidays, BusinessHolidays):
+            index = holidays.business_day_index(abs(days_int))
+            ordinal = None if index is None else index.add(self.to_date().toordinal(), days_int)
+            if ordinal is not None:
+                return self.__class__.from_date(date.fromordinal(ordinal))
+
         res = self.__deepcopy__()
+        steps = 0
         if days_int >= 0:
             count = 0
             while count < days_int:
                 res = res._add_days(1)
+                steps += 1
                 if res.is_business_day(holidays):
                     count += 1
         else:
             count = 0
             while count > days_int:
                 res = res._add_days(-1)
+                steps += 1
                 if res.is_business_day(holidays):
                     count -= 1
 
+        if instrumentation.ENABLED:
+            instrumentation.count('business day steps', steps)
         return res
 
     def _add_ymd(self, years=0, months=0, days=0):
@@ -330,9 +354,16 @@ class BusinessDate(BaseDateDatetimeDate):
         It is simply adding the number of `years`, `months` and `days` or
         if `businessdays` given the number of business days,
         i.e. days neither weekend nor in holidays (see also :meth:`BusinessDate.is_business_day`)
+
+        Results are cached if :code:`BusinessDate.RESULT_CACHE` is enabled
+        (see :meth:`BusinessDate.adjust`).
         """
 
         p = BusinessPeriod(period_obj)
+        holidays = self.__class__.DEFAULT_HOLIDAYS if holidays is None else holidays
+        return self._cached_result(_BusinessDate._add_period, p, holidays)
+
+    def _add_period(self, p, holidays):
         res = self
         res = res._add_business_days(p.businessdays, holidays)
         res = res._add_ymd(p.years, p.months, p.days)
@@ -342,43 +373,60 @@ class BusinessDate(BaseDateDatetimeDate):
         """ calculates the distance to a :class:`BusinessDate` in days """
         return int(self._diff_in_days(end_date))
 
-    def diff_in_ymd(self, end_date):
-
-        if end_date < self:
-            y,m,d = 0,0,0
-            while end_date < self._add_ymd(y,0,0):
-                y -= 1
-            while end_date < self._add_ymd(y+1,m,0):
-                m -= 1
-            while end_date < self._add_ymd(y+1,m+1,d):
-                d -= 1
-            return y+1, m+1, d
-
-        y = end_date.year - self.year
-        m = end_date.month - self.month
-        d = end_date.day - self.day
-
-        while m < 0:
-            y -= 1
-            m += 12
+    def diff_in_business_days(self, end_date, holidays=None):
+        """ calculates the distance to a :class:`BusinessDate` in business days
 
-        while d < 0:
-            m -= 1
-            if m < 0:
-                y -= 1
-                m += 12
-            d = self._add_ymd(y, m, 0)._diff_in_days(end_date)
+        Counts the business days after the date until (and including) `end_date`,
+        negative if `end_date` is before the date.
+        """
+        holidays = self.__class__.DEFAULT_HOLIDAYS if holidays is None else holidays
+        start, end = self.to_date(), BusinessDate(end_date).to_date()
+
+        if isinstance(holidays, BusinessHolidays):
+            index = holidays.business_day_index(abs(end.toordinal() - start.toordinal()))
+            count = None if index is None else index.count(start.toordinal(), end.toordinal())
+            if count is not None:
+                return count
+
+        sgn, (start, end) = (1, (start, end)) if start <= end else (-1, (end, start))
+        count = 0
+        while start < end:
+            start += timedelta(1)
+            if conventions.is_business_day(start, holidays):
+                count += 1
+        return sgn * count
 
-        # if not any((0 <= y, 0 <= m < 12, 0 <= d < 31)):
-        #     raise AssertionError((y,m,d))
-        # if not end_date == self._add_ymd(y, m, d):
-        #     raise AssertionError('%s!=%s==%s._add_ymd(%d,%d,%d)' %
-        #                    (end_date, self._add_ymd(y, m, d), self, y, m, d))
-        # if not self == end_date._add_ymd(-y, -m, -d) and min(end_date, self).day < 29:
-        #     raise AssertionError('%s!=%s==%s._add_ymd(%d,%d,%d)' %
-        #                    (self, end_date._add_ymd(-y, -m, -d), end_date, -y,-m,-d))
+    def diff_in_ymd(self, end_date):
+        """ calculates the distance to a :class:`BusinessDate` as :class:`tuple` `(years, months, days)`
 
-        return int(y), int(m), int(d)
+        The result is given such that adding it to the date by :meth:`BusinessDate.add_period`
+        gives `end_date` again, i.e. months are added first (capping the day at the month end)
+        and then days are added.
+        """
+        year, month, day = self.year, self.month, self.day
+        end_year, end_month, end_day = end_date.year, end_date.month, end_date.day
+        end = date(end_year, end_month, end_day).toordinal()
+        months = 12 * (end_year - year) + end_month - month
+
+        def month_day(k):
+            # ordinal of date moved by k months with day capped by month end (as by _add_ymd)
+            y, m = divmod(month - 1 + k, 12)
+            y += year
+            return date(y, m + 1, min(day, days_in_month(y, m + 1))).toordinal()
+
+        if end < date(year, month, day).toordinal():
+            # find last month move not after end_date and count days back from the following one
+            if end_day < min(day, days_in_month(end_year, end_month)):
+                months -= 1
+            return months // 12 + 1, months % 12 - 11, end - month_day(months + 1)
+
+        if end_day < day:
+            months -= 1
+            days = end - month_day(months)
+        else:
+            days = end_day - day
+        y, m = divmod(months, 12)
+        return int(y), int(m), int(days)
 
     # --- business day adjustment and day count fraction methods -----------------------------------------
 
@@ -387,9 +435,9 @@ class BusinessDate(BaseDateDatetimeDate):
 
         For more details on the conventions see module :mod:`businessdate.daycount`.
         """
-        convention = convention if convention else BusinessDate.DAY_COUNT
-        dc_func = self.__class__._dc_func
-        return dc_func[convention.lower()](self.to_date(), BusinessDate(end).to_date())
+        convention = convention if convention else self.__class__.DAY_COUNT
+        dc_func = self.__class__._day_count_function(convention)
+        return dc_func(self.to_date(), BusinessDate(end).to_date())
 
     def get_year_fraction(self, end=None, convention=''):
         """ wrapper for :meth:`BusinessDate.get_day_count` method for different naming preferences """
@@ -401,20 +449,149 @@ class BusinessDate(BaseDateDatetimeDate):
         For details on business days see :meth:`BusinessDate.is_business_day`.
 
         For more details on the conventions see module :mod:`businessdate.conventions`
+
+        Results of :meth:`BusinessDate.adjust` and :meth:`BusinessDate.add_period`
+        can be cached in the :class:`LRUCache <businessdate.lrucache.LRUCache>`
+        :code:`BusinessDate.RESULT_CACHE` which is disabled by default.
+        Enable it by :code:`BusinessDate.RESULT_CACHE.resize(maxsize)`,
+        get statistics by :code:`info()` and drop results by :code:`clear()`.
+        Results are cached only for :class:`BusinessHolidays` calendars
+        and are not used anymore once the calendar has been modified
+        (see :attr:`BusinessHolidays.version`).
         """
-        convention = convention if convention else BusinessDate.ADJUST
-        adj_func = self.__class__._adj_func
+        convention = convention if convention else self.__class__.ADJUST
+        adj_func = self.__class__._adjust_function(convention)
         holidays = self.__class__.DEFAULT_HOLIDAYS if holidays is None else holidays
-        return BusinessDate(adj_func[convention.lower()](self.to_date(), holidays))
+        return self._cached_result(_BusinessDate._adjust, adj_func, holidays)
+
+    def _adjust(self, adj_func, holidays):
+        return self.__class__(adj_func(self.to_date(), holidays))
+
+    def _cached_result(self, func, arg, holidays):
+        # returns func(self, arg, holidays) using RESULT_CACHE as long as holidays are not modified
+        cache = self.__class__.RESULT_CACHE
+        if cache.maxsize == 0:
+            return func(self, arg, holidays)
+        version = getattr(holidays, 'version', None)
+        if version is None:
+            return func(self, arg, holidays)
+
+        key = self.__class__, self, func.__name__, arg, id(holidays), version
+        cached = cache.get(key)
+        if cached is not None and cached[0] is holidays:
+            return cached[1]
+        res = func(self, arg, holidays)
+        cache.set(key, (holidays, res))
+        return res
+
+    # --- convention registry methods ----------------------------------------
+
+    @classmethod
+    def _adjust_function(cls, convention):
+        # resolves key word (or function itself) of business day convention to function
+        adj_func = cls._adj_func.get(convention)
+        if adj_func is None:
+            adj_func = convention if callable(convention) else cls._adj_func[convention.lower()]
+        return adj_func
+
+    @classmethod
+    def _day_count_function(cls, convention):
+        # resolves key word (or function itself) of day count convention to function
+        dc_func = cls._dc_func.get(convention)
+        if dc_func is None:
+            dc_func = convention if callable(convention) else cls._dc_func[convention.lower()]
+        return dc_func
+
+    @classmethod
+    def register_adjust_convention(cls, adj_func, *names):
+        """ registers a business day adjustment convention
+
+        :param adj_func: function :code:`adj_func(business_date, holidays)`
+         returning the adjusted :class:`datetime.date`
+         (see :mod:`businessdate.conventions` for examples)
+        :param str names: key words of the convention
+
+        The key words can be used by :meth:`BusinessDate.adjust`
+        (as the function `adj_func` itself can be, too)
+        and in date strings like **0BMODFOLLOW**.
+        For each key word, e.g. **mod_follow**,
+        a method :code:`adjust_mod_follow(holidays=None)` is added.
+        """
+        for name in names:
+            name = name.lower()
+            _BusinessDate._adj_func[name] = adj_func
+            _BusinessDate._add_shortcut('adjust_' + name, _adjust_shortcut(adj_func))
+        DateExpression.set_conventions(_BusinessDate._adj_func.keys())
+
+    @classmethod
+    def register_day_count(cls, dc_func, *names):
+        """ registers a day count convention
+
+        :param dc_func: function :code:`dc_func(start, end)`
+         returning the year fraction between two :class:`datetime.date`
+         (see :mod:`businessdate.daycount` for examples)
+        :param str names: key words of the convention
+
+        The key words can be used by :meth:`BusinessDate.get_day_count`
+        (as the function `dc_func` itself can be, too).
+        For each key word, e.g. **act_360**,
+        a method :code:`get_act_360(end)` is added.
+        """
+        for name in names:
+            name = name.lower()
+            _BusinessDate._dc_func[name] = dc_func
+            _BusinessDate._add_shortcut('get_' + name, _day_count_shortcut(dc_func))
+
+    @classmethod
+    def _add_shortcut(cls, name, method):
+        if name not in cls._shortcuts and hasattr(cls, name):
+            raise ValueError("Cannot register %s as it is an attribute of %s" % (name, cls.__name__))
+        cls._shortcuts.add(name)
+        method.__name__ = name
+        setattr(cls, name, method)
+
+
+def _adjust_shortcut(adj_func):
+    def shortcut(self, holidays=None):
+        return self.adjust(adj_func, holidays)
+    return shortcut
+
+
+def _day_count_shortcut(dc_func):
+    def shortcut(self, end):
+        return self.get_day_count(end, dc_func)
+    return shortcut
+
+
+for _name, _func in _BusinessDate._adj_func.items():
+    _BusinessDate._add_shortcut('adjust_' + _name, _adjust_shortcut(_func))
+for _name, _func in _BusinessDate._dc_func.items():
+    _BusinessDate._add_shortcut('get_' + _name, _day_count_shortcut(_func))
+del _name, _func
+
+
+class BusinessDate(_BusinessDate, BaseDateDatetimeDate):
+    pass
+
+
+class OrdinalBusinessDate(_BusinessDate, BaseDateOrdinal):
+    """ :class:`BusinessDate` backed by :class:`BaseDateOrdinal`
+
+    Offers the same functionality as :class:`BusinessDate` but instances are immutable,
+    have :code:`__slots__` and no :code:`__dict__`
+    which saves memory on large portfolios of dates.
+    Calculations return :class:`OrdinalBusinessDate` instances, too.
+    Instances compare and hash like their proleptic Gregorian ordinals
+    (see :meth:`datetime.date.toordinal`), so use :meth:`to_date` to compare with other date types.
+
+    Note, class wide settings like :code:`DEFAULT_HOLIDAYS` or :code:`BASE_DATE`
+    have to be set for :class:`OrdinalBusinessDate` separately.
+    """
 
+    __slots__ = ()
 
-    def __getattr__(self, item):
-        if item.startswith('adjust_'):
-            return  lambda h=None: self.adjust(item.replace('adjust_',''), h)
-        if item.startswith('get_'):
-            return  lambda e: self.get_year_fraction(e, item.replace('get_',''))
-        raise AttributeError("'%s' object has no attribute '%s'" % (self.__class__.__name__, item))
 
+DateExpression.set_conventions(BusinessDate._adj_func.keys())
 
 # add additional __doc__ at runtime (during import)
 try:
@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+
+# businessdate
+# ------------
+# Python library for generating business dates for fast date operations
+# and rich functionality.
+#
+# Author:   sonntagsgesicht, based on a fork of Deutsche Postbank [pbrisk]
+# Version:  0.5, copyright Wednesday, 18 September 2019
+# Website:  https://github.com/sonntagsgesicht/businessdate
+# License:  Apache License 2.0 (see LICENSE file)
+
+
+from calendar import WEDNESDAY
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from . import conventions
+from . import daycount
+from .ymd import from_excel_to_ymd_array, from_ymd_to_excel_array
+from .businessholidays import BusinessHolidays
+from .businessperiod import BusinessPeriod
+from .businessdate import BusinessDate
+
+# ordinal of 30.12.1899 and first ordinal not hit by the excel 29.2.1900 bug
+_EXCEL_OFFSET = 693594
+_EXCEL_BUG_ORDINAL = 693655
+
+_DAYS_IN_MONTH = 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31
+
+
+def _to_ordinal(excel):
+    excel = np.asarray(excel, dtype=np.int64)
+    return excel + np.where(excel > 60, _EXCEL_OFFSET, _EXCEL_OFFSET + 1)
+
+
+def _from_ordinal(ordinal):
+    ordinal = np.asarray(ordinal, dtype=np.int64)
+    return ordinal - np.where(ordinal < _EXCEL_BUG_ORDINAL, _EXCEL_OFFSET + 1, _EXCEL_OFFSET)
+
+
+def _days_in_month(year, month):
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    return np.asarray(_DAYS_IN_MONTH)[month - 1] + (leap & (month == 2))
+
+
+def _weekday(ordinal):
+    return (ordinal + 6) % 7
+
+
+class BusinessDateArray(object):
+    """ array of business dates for vectorized date calculations
+
+    :param values: dates given either as
+     :class:`numpy.ndarray` of int holding dates in Microsoft Excel representation
+     (as :func:`businessdate.ymd.from_ymd_to_excel`),
+     :class:`numpy.ndarray` of :class:`numpy.datetime64`,
+     or iterable of :class:`BusinessDate`, :class:`datetime.date`
+     or anything else :class:`BusinessDate` can be build from.
+
+    Dates are stored as :class:`numpy.int32` array
+    in Microsoft Excel representation.
+    An :class:`numpy.int32` array is used without copy.
+
+    Methods mimic those of :class:`BusinessDate`
+    and give element by element the same result.
+    Day counts use the array versions of the :mod:`businessdate.daycount` functions.
+    Business day conventions and business days
+    are vectorized if `holidays` are :class:`BusinessHolidays`
+    and the dates are covered by its :class:`BusinessDayIndex`.
+    Otherwise, the scalar :class:`BusinessDate` methods are used.
+
+    Requires :mod:`numpy`.
+    """
+
+    def __init__(self, values=()):
+        if np is None:
+            raise ImportError('%s requires numpy' % self.__class__.__name__)
+        if isinstance(values, BusinessDateArray):
+            values = values.to_excel()
+        elif isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.datetime64):
+            values = self.from_datetime64(values).to_excel()
+        elif not isinstance(values, np.ndarray):
+            values = [v if isinstance(v, date) else BusinessDate(v) for v in values]
+            values = _from_ordinal(np.fromiter((v.toordinal() for v in values), np.int64, len(values)))
+        self._excel = np.asarray(values, dtype=np.int32)
+
+    # --- constructor method -------------------------------------------------
+
+    @classmethod
+    def from_excel(cls, excel):
+        """ creates instance from array of int in Microsoft Excel representation (without copy if possible) """
+        return cls(np.asarray(excel, dtype=np.int32))
+
+    @classmethod
+    def from_ordinals(cls, ordinals):
+        """ creates instance from array of ordinals (see :meth:`datetime.date.toordinal`) """
+        return cls(_from_ordinal(ordinals))
+
+    @classmethod
+    def from_ymd(cls, year, month, day):
+        """ creates instance from arrays of int `year`, `month` and `day` """
+        return cls(from_ymd_to_excel_array(year, month, day))
+
+    @classmethod
+    def from_datetime64(cls, values):
+        """ creates instance from array of :class:`numpy.datetime64` """
+        days = np.asarray(values).astype('datetime64[D]').view(np.int64)
+        return cls.from_ordinals(days + date(1970, 1, 1).toordinal())
+
+    # --- cast method --------------------------------------------------------
+
+    def to_excel(self):
+        """ returns the underlying :class:`numpy.int32` array in Microsoft Excel representation """
+        return self._excel
+
+    def to_ordinals(self):
+        """ returns array of ordinals (see :meth:`datetime.date.toordinal`) """
+        return _to_ordinal(self._excel)
+
+    def to_ymd(self):
+        """ returns the :class:`tuple` of arrays `(year, month, day)` """
+        return from_excel_to_ymd_array(self._excel)
+
+    def to_datetime64(self):
+        """ returns array of :class:`numpy.datetime64` """
+        return (self.to_ordinals() - date(1970, 1, 1).toordinal()).astype('datetime64[D]')
+
+    def to_list(self):
+        """ returns :class:`list` of :class:`BusinessDate` """
+        return [BusinessDate(y, m, d) for y, m, d in zip(*(a.tolist() for a in self.to_ymd()))]
+
+    # --- property methods ---------------------------------------------------
+
+    @property
+    def year(self):
+        return self.to_ymd()[0]
+
+    @property
+    def month(self):
+        return self.to_ymd()[1]
+
+    @property
+    def day(self):
+        return self.to_ymd()[2]
+
+    def weekday(self):
+        return _weekday(self.to_ordinals())
+
+    # --- operator methods ---------------------------------------------------
+
+    def __len__(self):
+        return len(self._excel)
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            return BusinessDate.from_date(date.fromordinal(int(_to_ordinal(self._excel[item]))))
+        return self.__class__(self._excel[item])
+
+    def __array__(self, dtype=None, copy=None):
+        return self._excel if dtype is None else self._excel.astype(dtype)
+
+    def __eq__(self, other):
+        if isinstance(other, BusinessDateArray):
+            return np.array_equal(self._excel, other.to_excel())
+        return self.to_list() == list(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return self.__class__.__name__ + '(%s)' % str(self.to_list())
+
+    # --- validation and information methods ------------------------
+
+    def end_of_month(self):
+        """ returns the days of the end of the month as :class:`BusinessDateArray` """
+        year, month, _ = self.to_ymd()
+        return self.from_ymd(year, month, _days_in_month(year, month))
+
+    def is_business_day(self, holidays=None):
+        """ returns bool array which is `True` for dates falling neither on weekend nor in holidays """
+        holidays = BusinessDate.DEFAULT_HOLIDAYS if holidays is None else holidays
+        ordinals = self.to_ordinals()
+        res = np.zeros(len(ordinals), dtype=bool)
+        todo = np.ones(len(ordinals), dtype=bool)
+        index = _index(holidays, len(ordinals))
+        if index is not None:
+            cum, pos, todo = _window(index, ordinals)
+            res[~todo] = cum[pos[~todo] + 1] > cum[pos[~todo]]
+        for i in np.flatnonzero(todo):
+            res[i] = conventions.is_business_day(date.fromordinal(int(ordinals[i])), holidays)
+        return res
+
+    # --- calculation methods --------------------------------------------
+
+    def _add_business_days(self, days_int, holidays=None):
+        holidays = BusinessDate.DEFAULT_HOLIDAYS if holidays is None else holidays
+        ordinals = self.to_ordinals()
+        if not days_int:
+            return ordinals
+
+        res, todo = ordinals.copy(), np.ones(len(ordinals), dtype=bool)
+        index = _index(holidays, len(ordinals) * abs(days_int))
+        if index is not None:
+            cum, pos, todo = _window(index, ordinals)
+            if days_int > 0:
+                i = np.searchsorted(cum, cum[pos + 1] + days_int, 'left')
+                todo |= len(cum) <= i
+            else:
+                target = cum[pos] + days_int
+                i = np.searchsorted(cum, target, 'right')
+                todo |= target < 0
+            res = np.where(todo, res, index.first + i - 1)
+
+        for i in np.flatnonzero(todo):
+            d = BusinessDate.from_date(date.fromordinal(int(ordinals[i])))
+            res[i] = d._add_business_days(days_int, holidays).toordinal()
+        return res
+
+    def _add_ymd(self, years=0, months=0, days=0):
+        year, month, day = self.to_ymd()
+        month_index = 12 * (year + years) + (month - 1) + months
+        year, month = month_index // 12, month_index % 12 + 1
+        day = np.minimum(day, _days_in_month(year, month))
+        return _to_ordinal(from_ymd_to_excel_array(year, month, day)) + days
+
+    def add_period(self, period_obj, holidays=None):
+        """ adds a :class:`BusinessPeriod` object
+        or anythings that create one and returns :class:`BusinessDateArray` object.
+
+        For details see :meth:`BusinessDate.add_period`.
+        """
+        p = BusinessPeriod(period_obj)
+        res = self
+        if p.businessdays:
+            res = self.from_ordinals(res._add_business_days(p.businessdays, holidays))
+        if p.years or p.months or p.days:
+            res = self.from_ordinals(res._add_ymd(p.years, p.months, p.days))
+        return res
+
+    def diff_in_days(self, end_date):
+        """ calculates the distance to dates (array or single date) in days """
+        return _ordinals(end_date) - self.to_ordinals()
+
+    # --- business day adjustment and day count fraction methods -----------------------------------------
+
+    def get_day_count(self, end=None, convention=''):
+        """ counts the days as a year fraction to given dates following the specified convention.
+
+        For details see :meth:`BusinessDate.get_day_count`.
+        """
+        convention = convention if convention else BusinessDate.DAY_COUNT
+        dc_func = BusinessDate._day_count_function(convention)
+        if dc_func in daycount._array_func:
+            return daycount._array_func[dc_func](self._excel, _from_ordinal(_ordinals(end)))
+        end = np.broadcast_to(_ordinals(end), (len(self),))
+        return np.array([dc_func(date.fromordinal(int(s)), date.fromordinal(int(e)))
+                         for s, e in zip(self.to_ordinals(), end)], dtype=float)
+
+    def get_year_fraction(self, end=None, convention=''):
+        """ wrapper for :meth:`BusinessDateArray.get_day_count` method for different naming preferences """
+        return self.get_day_count(end, convention)
+
+    def adjust(self, convention='', holidays=None):
+        """ returns an adjusted :class:`BusinessDateArray` following the specified convention.
+
+        For details see :meth:`BusinessDate.adjust`.
+        """
+        convention = convention if convention else BusinessDate.ADJUST
+        adj_func = BusinessDate._adjust_function(convention)
+        holidays = BusinessDate.DEFAULT_HOLIDAYS if holidays is None else holidays
+        ordinals = self.to_ordinals()
+
+        if adj_func is conventions.adjust_no:
+            return self
+        if adj_func in (conventions.adjust_imm, conventions.adjust_cds_imm):
+            year, month, _ = self.to_ymd()
+            day = 15 if adj_func is conventions.adjust_imm else 20
+            ordinals = _to_ordinal(from_ymd_to_excel_array(year, month + (-month % 3), day))
+            if adj_func is conventions.adjust_imm:
+                ordinals += _weekday(ordinals) == WEDNESDAY
+            return self.from_ordinals(ordinals)
+        if adj_func is conventions.adjust_start_of_month:
+            ordinals -= self.day - 1
+            return self.from_ordinals(_adjust(ordinals, conventions.adjust_follow, holidays))
+        if adj_func is conventions.adjust_end_of_month:
+            ordinals = self.end_of_month().to_ordinals()
+            return self.from_ordinals(_adjust(ordinals, conventions.adjust_previous, holidays))
+        if adj_func in (conventions.adjust_mod_follow, conventions.adjust_mod_previous):
+            first, second = conventions.adjust_follow, conventions.adjust_previous
+            if adj_func is conventions.adjust_mod_previous:
+                first, second = second, first
+            res = self.from_ordinals(_adjust(ordinals, first, holidays))
+            other = self.from_ordinals(_adjust(ordinals, second, holidays))
+            return self.from_ordinals(np.where(res.month == self.month, res.to_ordinals(), other.to_ordinals()))
+        return self.from_ordinals(_adjust(ordinals, adj_func, holidays))
+
+
+def _ordinals(values):
+    if isinstance(values, BusinessDateArray):
+        return values.to_ordinals()
+    if isinstance(values, date):
+        return values.toordinal()
+    if isinstance(values, (list, tuple, np.ndarray)):
+        return BusinessDateArray(values).to_ordinals()
+    return BusinessDate(values).toordinal()
+
+
+def _index(holidays, days):
+    if isinstance(holidays, BusinessHolidays):
+        return holidays.business_day_index(days)
+    return None
+
+
+def _window(index, ordinals):
+    # returns cumulative counts, positions in index and mask of ordinals not covered
+    cum = np.frombuffer(index._cum, dtype=np.int32)
+    outside = (ordinals < index.first) | (index.last <= ordinals)
+    pos = np.where(outside, 0, ordinals - index.first)
+    return cum, pos, outside
+
+
+def _adjust(ordinals, adj_func, holidays):
+    # vectorized follow and previous, scalar fallback for anything else
+    res, todo = ordinals.copy(), np.ones(len(ordinals), dtype=bool)
+    index = None
+    if adj_func in (conventions.adjust_follow, conventions.adjust_previous):
+        index = _index(holidays, len(ordinals))
+    if index is not None:
+        cum, pos, todo = _window(index, ordinals)
+        if adj_func is conventions.adjust_follow:
+            i = np.searchsorted(cum, cum[pos] + 1, 'left')
+            todo |= len(cum) <= i
+        else:
+            value = cum[pos + 1]
+            i = np.searchsorted(cum, value, 'left')
+            todo |= value == 0
+        res = np.where(todo, res, index.first + i - 1)
+
+    for i in np.flatnonzero(todo):
+        res[i] = adj_func(date.fromordinal(int(ordinals[i])), holidays).toordinal()
+    return res
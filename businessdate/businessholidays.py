@@ -11,9 +11,41 @@
 # License:  Apache License 2.0 (see LICENSE file)
 
 
-from datetime import date, timedelta
+import mmap as _mmap
+import struct
+import sys
 
-from .ymd import easter
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, MINYEAR, MAXYEAR
+from threading import Lock
+
+from .conventions import is_business_day
+from .holidayrules import FixedHoliday, EasterHoliday
+
+
+# binary calendar file: header, business day bitmap (padded to 4 bytes) and cumulative counts (int32)
+_FILE_MAGIC = b'BDCAL'
+_FILE_VERSION = 1
+_FILE_HEADER = struct.Struct('<5sB2xiiiB11x')  # magic, version, from_year, to_year, days, weekmask
+
+# Python 2 memoryview neither maps files nor casts to int, so calendar files are copied there
+_MEMORYVIEW_CAST = hasattr(memoryview, 'cast')
+
+
+_WORKWEEK = (True,) * 5 + (False,) * 2
+
+
+def _to_date(item):
+    return item if isinstance(item, date) else date(item.year, item.month, item.day)
+
+
+def _workweek(holidays):
+    # seven flags from Monday to Sunday of days which are not weekend of any holiday container
+    if isinstance(holidays, BusinessHolidays):
+        return holidays._workweek()
+    weekmask = getattr(holidays, 'weekmask', None)
+    return _WORKWEEK if weekmask is None else tuple(weekmask)
 
 
 class BusinessHolidays(list):
@@ -26,21 +58,549 @@ class BusinessHolidays(list):
     For convenience input need not to be of type :class:`datetime.date`.
     Duck typing is enough, i.e. having properties
     `year`, `month` and `day`.
+
+    Membership is checked against a :class:`set` of ordinals
+    (see :meth:`datetime.date.toordinal`) which is kept in sync
+    with the list on every modification,
+    so `in` does not depend on the number of holidays.
+
+    Business day arithmetic on a calendar is done by a
+    :class:`BusinessDayIndex` covering the years
+    :attr:`BusinessHolidays.INDEX_YEARS`.
+    It is built once more than :attr:`BusinessHolidays.INDEX_DAYS` days
+    have been checked day by day since the last modification
+    and dropped on every modification,
+    so one-off calculations on a calendar do not pay for a full index.
+
+    Every modification increments :attr:`BusinessHolidays.version`,
+    so results calculated with a calendar can be cached as long as its version does not change.
     """
 
+    INDEX_YEARS = 1980, 2080
+    # days checked day by day before the index is built (about half the cost of building it)
+    INDEX_DAYS = 2 ** 14
+
+    # counts modifications of any calendar
+    _modifications = 0
+
     def __init__(self, iterable=()):
         if iterable:
             # iterable = map(BusinessDate, iterable)
-            iterable = [bd if isinstance(bd, date) else date(bd.year, bd.month, bd.day) for bd in iterable]
+            iterable = [_to_date(bd) for bd in iterable]
         super(BusinessHolidays, self).__init__(iterable)
+        self._ordinals = set(d.toordinal() for d in self)
+        self._version = 0
+        self._index = None
+        self._walked = 0
+
+    def __contains__(self, item):
+        if isinstance(item, date):
+            return item.toordinal() in self._ordinals
+        return date(item.year, item.month, item.day).toordinal() in self._ordinals
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    @property
+    def version(self):
+        """ number of modifications of the calendar """
+        return self._version
+
+    def business_day_index(self, days=None):
+        """ returns the :class:`BusinessDayIndex` of the calendar over :attr:`INDEX_YEARS`
+
+        :param int days: number of days the caller checks day by day without index (optional)
+
+        If `days` are given and the index has not been built yet,
+        the index is built only once the days given since the last modification
+        exceed :attr:`INDEX_DAYS`. Before `None` is returned.
+        """
+        index = self._index
+        if index is None:
+            if days is not None:
+                self._walked += days
+                if self._walked <= self.INDEX_DAYS:
+                    return None
+            index = BusinessDayIndex(self, *self.INDEX_YEARS)
+            self._index = index
+        return index
+
+    # --- file methods ---------------------------------------------------------
+
+    def save(self, path, from_year=None, to_year=None):
+        """ saves business days of the calendar to a binary calendar file
+
+        :param str path: file name
+        :param int from_year: first year stored (default: first of :attr:`INDEX_YEARS`)
+        :param int to_year: last year stored (default: last of :attr:`INDEX_YEARS`)
+
+        The file consists of a header incl. the weekend of the calendar
+        (for a :class:`JointCalendar` the weekend joined from its calendars),
+        a bitmap of business days and the cumulative business day counts of :class:`BusinessDayIndex`.
+        Load it by :meth:`BusinessHolidays.load`.
+        """
+        from_year = self.INDEX_YEARS[0] if from_year is None else from_year
+        to_year = self.INDEX_YEARS[1] if to_year is None else to_year
+        if (from_year, to_year) == tuple(self.INDEX_YEARS):
+            index = self.business_day_index()
+        else:
+            index = BusinessDayIndex(self, from_year, to_year)
+
+        days = index.last - index.first
+        cum = array('i', index._cum)
+        bitmap = bytearray((days + 31) // 32 * 4)
+        for i in range(days):
+            if cum[i] < cum[i + 1]:
+                bitmap[i >> 3] |= 1 << (i & 7)
+        weekmask = sum(1 << i for i, flag in enumerate(self._workweek()) if flag)
+        if not sys.byteorder == 'little':
+            cum.byteswap()
+
+        with open(path, 'wb') as f:
+            f.write(_FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, from_year, to_year, days, weekmask))
+            f.write(bitmap)
+            f.write(cum.tobytes() if _MEMORYVIEW_CAST else cum.tostring())
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """ loads a calendar from a binary calendar file (see :meth:`BusinessHolidays.save`)
+
+        :param str path: file name
+        :param bool mmap: if `True` the file is mapped into memory rather than read (default: `True`)
+        :return: :class:`BinaryHolidays`
+        """
+        return BinaryHolidays(path, mmap)
+
+    def _workweek(self):
+        # flags of days which are not weekend (as stored in calendar files)
+        weekmask = getattr(self, 'weekmask', None)
+        return _WORKWEEK if weekmask is None else tuple(weekmask)
+
+    # --- list modification methods ------------------------------------------
+
+    def _changed(self, rebuild=True):
+        if rebuild:
+            self._ordinals = set(d.toordinal() for d in self)
+        self._version += 1
+        self._index = None
+        self._walked = 0
+        BusinessHolidays._modifications += 1
+
+    def append(self, item):
+        item = _to_date(item)
+        super(BusinessHolidays, self).append(item)
+        self._ordinals.add(item.toordinal())
+        self._changed(False)
+
+    def extend(self, iterable):
+        iterable = [_to_date(d) for d in iterable]
+        super(BusinessHolidays, self).extend(iterable)
+        self._ordinals.update(d.toordinal() for d in iterable)
+        self._changed(False)
+
+    def insert(self, index, item):
+        item = _to_date(item)
+        super(BusinessHolidays, self).insert(index, item)
+        self._ordinals.add(item.toordinal())
+        self._changed(False)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def remove(self, item):
+        super(BusinessHolidays, self).remove(_to_date(item))
+        self._changed()
+
+    def pop(self, index=-1):
+        item = super(BusinessHolidays, self).pop(index)
+        self._changed()
+        return item
+
+    def clear(self):
+        self.__delitem__(slice(None))
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            value = [_to_date(d) for d in value]
+        else:
+            value = _to_date(value)
+        super(BusinessHolidays, self).__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super(BusinessHolidays, self).__delitem__(key)
+        self._changed()
+
+    # Python 2 slicing by `h[i:j]` bypasses __setitem__ and __delitem__
+    def __setslice__(self, i, j, sequence):
+        self.__setitem__(slice(i, j), sequence)
+
+    def __delslice__(self, i, j):
+        self.__delitem__(slice(i, j))
+
+    def __imul__(self, other):
+        super(BusinessHolidays, self).__imul__(other)
+        self._changed()
+        return self
+
+
+class BusinessDayIndex(object):
+    """ cumulative business day count of a holiday calendar
+
+    :param holidays: container of holidays (see :func:`businessdate.conventions.is_business_day`)
+    :param int from_year: first year covered by the index
+    :param int to_year: last year covered by the index
+
+    Stores for any day in the years `from_year` to `to_year`
+    the number of business days before,
+    so that business day arithmetic becomes a lookup plus a binary search.
+
+    All methods take and return ordinals (see :meth:`datetime.date.toordinal`).
+    Methods return `None` if the result is not covered by the index.
+    """
+
+    def __init__(self, holidays=(), from_year=1980, to_year=2080):
+        self.first = date(from_year, 1, 1).toordinal()
+        self.last = date(to_year + 1, 1, 1).toordinal()
+
+        cum, count = array('i', [0]), 0
+        for ordinal in range(self.first, self.last):
+            if is_business_day(date.fromordinal(ordinal), holidays):
+                count += 1
+            cum.append(count)
+        # cum[i] counts business days from first (incl.) to first + i (excl.)
+        self._cum = cum
+
+    @classmethod
+    def from_counts(cls, counts, first):
+        """ creates index from cumulative business day counts `counts` starting at ordinal `first` """
+        index = cls.__new__(cls)
+        index.first = first
+        index.last = first + len(counts) - 1
+        index._cum = counts
+        return index
+
+    def __contains__(self, ordinal):
+        return self.first <= ordinal < self.last
+
+    def is_business_day(self, ordinal):
+        """ returns `True` if the day is a business day """
+        if ordinal not in self:
+            return None
+        i = ordinal - self.first
+        return self._cum[i] < self._cum[i + 1]
+
+    def add(self, ordinal, n):
+        """ returns the `n`-th business day after (or before if `n` is negative) the given day """
+        if ordinal not in self:
+            return None
+        if not n:
+            return ordinal
+        cum = self._cum
+        if n > 0:
+            i = bisect_left(cum, cum[ordinal - self.first + 1] + n)
+            return self.first + i - 1 if i < len(cum) else None
+        target = cum[ordinal - self.first] + n
+        if target < 0:
+            return None
+        return self.first + bisect_right(cum, target) - 1
+
+    def follow(self, ordinal):
+        """ returns the first business day on or after the given day """
+        if ordinal not in self:
+            return None
+        cum = self._cum
+        i = bisect_left(cum, cum[ordinal - self.first] + 1)
+        return self.first + i - 1 if i < len(cum) else None
+
+    def previous(self, ordinal):
+        """ returns the last business day on or before the given day """
+        if ordinal not in self:
+            return None
+        cum = self._cum
+        value = cum[ordinal - self.first + 1]
+        if not value:
+            return None
+        return self.first + bisect_left(cum, value) - 1
+
+    def count(self, start, end):
+        """ returns the number of business days after `start` until (and including) `end`
+
+        The count is negative if `end` is before `start`,
+        so that `add(start, count(start, end))` is the last business day on or before `end`.
+        """
+        if start not in self or end not in self:
+            return None
+        return self._cum[end - self.first + 1] - self._cum[start - self.first + 1]
+
+
+class BinaryHolidays(BusinessHolidays):
+    """ holiday calendar class loaded from a binary calendar file
+
+    :param str path: file name of calendar file (see :meth:`BusinessHolidays.save`)
+    :param bool mmap: if `True` the file is mapped into memory rather than read
+     (default: `True`, files are always read on Python 2)
+    :param iterable: additional holidays (optional)
+
+    Lookups and the :class:`BusinessDayIndex` work directly on the file content,
+    so loading does not depend on the number of years stored and
+    processes mapping the same file share its memory.
+
+    Any non business day is a holiday of the calendar,
+    so a :class:`BinaryHolidays` has no weekend by its own
+    (i.e. :code:`weekmask` is :code:`'1111111'`).
+    Outside the years stored only weekends (as stored) are holidays.
+    """
+
+    def __init__(self, path, mmap=True, iterable=()):
+        super(BinaryHolidays, self).__init__(iterable)
+        self.path = path
+        self.mmap = mmap
+        with open(path, 'rb') as f:
+            if not _MEMORYVIEW_CAST:
+                data = bytearray(f.read())
+            elif mmap:
+                data = memoryview(_mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ))
+            else:
+                data = memoryview(f.read())
+
+        magic, version, from_year, to_year, days, weekmask = _FILE_HEADER.unpack_from(data)
+        if not (magic == _FILE_MAGIC and version == _FILE_VERSION):
+            raise ValueError("%s is not a calendar file for %s" % (path, self.__class__.__name__))
+        self.weekmask = (True,) * 7
+        self._weekmask = tuple(bool(weekmask >> i & 1) for i in range(7))
+        self._first = date(from_year, 1, 1).toordinal()
+        self._days = days
+
+        start = _FILE_HEADER.size
+        end = start + (days + 31) // 32 * 4
+        self._bitmap = data[start:end]
+        counts = data[end:end + 4 * (days + 1)]
+        if sys.byteorder == 'little' and _MEMORYVIEW_CAST:
+            counts = counts.cast('i')
+        else:
+            counts = array('i', bytes(counts))
+            if not sys.byteorder == 'little':
+                counts.byteswap()
+        self._counts = counts
+        if not iterable:
+            self._index = BusinessDayIndex.from_counts(counts, self._first)
+
+    def __reduce__(self):
+        return self.__class__, (self.path, self.mmap, list(self))
+
+    def _workweek(self):
+        return self._weekmask
 
     def __contains__(self, item):
-        if super(BusinessHolidays, self).__contains__(item):
+        ordinal = item.toordinal() if isinstance(item, date) else date(item.year, item.month, item.day).toordinal()
+        if ordinal in self._ordinals:
             return True
-        return super(BusinessHolidays, self).__contains__(date(item.year, item.month, item.day))
+        i = ordinal - self._first
+        if 0 <= i < self._days:
+            return not self._bitmap[i >> 3] >> (i & 7) & 1
+        return not self._weekmask[date.fromordinal(ordinal).weekday()]
+
+
+class RuleBasedHolidays(BusinessHolidays):
+    """ holiday calendar class generating holidays by rules
+
+    :param iterable: additional holidays (optional)
+    :param rules: list of :class:`HolidayRule <businessdate.holidayrules.HolidayRule>`
+     (default: :attr:`RuleBasedHolidays.RULES`)
+    :param weekmask: seven flags from Monday to Sunday marking days of the week
+     which are not weekend, e.g. :code:`'1111100'`
+     (default: :attr:`RuleBasedHolidays.WEEKMASK`)
+
+    Holidays of a year are generated on first request of a date in that year
+    (see :mod:`businessdate.holidayrules` for available rules).
+    Then the year is materialized into a bit mask of the holidays,
+    so lookups take a single bit operation and memory scales with
+    the years actually used.
 
+    Generation is guarded by a lock and done exactly once per year,
+    while requests on years already generated take no lock.
+    Use :meth:`RuleBasedHolidays.warm` to generate a range of years in advance.
+
+    Generated holidays are added to the list, too.
+    A year of which all holidays have been removed is generated again on request.
+    """
+
+    RULES = ()
+    WEEKMASK = '1111100'
+
+    def __init__(self, iterable=(), rules=None, weekmask=None):
+        super(RuleBasedHolidays, self).__init__(iterable)
+        self.rules = tuple(self.RULES if rules is None else rules)
+        weekmask = self.WEEKMASK if weekmask is None else weekmask
+        self.weekmask = tuple(bool(int(flag)) for flag in weekmask)
+        if not len(self.weekmask) == 7:
+            raise ValueError("weekmask %s must contain seven flags" % str(weekmask))
+        self._lock = Lock()
+        self._years = frozenset()
+        self._masks = dict()
+
+    def __reduce__(self):
+        return self.__class__, (list(self), self.rules, self.weekmask)
+
+    def __contains__(self, item):
+        mask = self._masks.get(item.year)
+        if mask is None:
+            mask = self._materialize(item.year)
+        first, bits = mask
+        ordinal = item.toordinal() if isinstance(item, date) else date(item.year, item.month, item.day).toordinal()
+        return bool(bits >> (ordinal - first) & 1)
 
-class TargetHolidays(BusinessHolidays):
+    def _changed(self, rebuild=True):
+        super(RuleBasedHolidays, self)._changed(rebuild)
+        if rebuild:
+            years = set(d.year for d in self)
+            self._years = frozenset(y for y in self._years if y in years)
+        # masks are materialized again from holidays on request
+        self._masks = dict()
+
+    def _generate(self, year):
+        days = list()
+        for rule in self.rules:
+            days.extend(rule.dates(year))
+        # generated days do not modify the calendar, so neither version nor index change
+        ordinals = self._ordinals
+        days = sorted(set(d for d in days if d.toordinal() not in ordinals))
+        list.extend(self, days)
+        # publish new sets by assignment, so readers never see a set during update
+        self._ordinals = ordinals.union(d.toordinal() for d in days)
+        self._years = self._years.union((year,))
+        # observance may move holidays into neighbouring years
+        for d in days:
+            if not d.year == year:
+                self._masks.pop(d.year, None)
+
+    def _materialize(self, year):
+        with self._lock:
+            mask = self._masks.get(year)
+            if mask is not None:
+                return mask
+
+            # holidays of neighbouring years may be moved into this year by observance
+            years = (year,)
+            if any(rule.observance is not None for rule in self.rules):
+                years = range(max(MINYEAR, year - 1), min(MAXYEAR, year + 1) + 1)
+            for y in years:
+                if y not in self._years:
+                    self._generate(y)
+
+            first, last = date(year, 1, 1).toordinal(), date(year, 12, 31).toordinal()
+            bits = 0
+            for ordinal in self._ordinals:
+                if first <= ordinal <= last:
+                    bits |= 1 << (ordinal - first)
+            mask = first, bits
+            self._masks[year] = mask
+            return mask
+
+    def warm(self, from_year, to_year):
+        """ generates holidays of all years from `from_year` to `to_year` (incl.) in advance """
+        for year in range(from_year, to_year + 1):
+            if year not in self._masks:
+                self._materialize(year)
+        return self
+
+
+class JointCalendar(BusinessHolidays):
+    """ holiday calendar class joining several calendars
+
+    :param calendars: list of holiday calendars
+     (see :func:`businessdate.conventions.is_business_day`)
+    :param str join: either :code:`'holidays'` for a day to be a holiday
+     if it is a holiday (or weekend) in any of the calendars
+     or :code:`'businessdays'` for a day to be a business day
+     if it is a business day in any of the calendars (default: :code:`'holidays'`)
+    :param iterable: additional holidays (optional)
+
+    Weekends of the calendars are joined as holidays,
+    so a :class:`JointCalendar` has no weekend by its own
+    (i.e. :code:`weekmask` is :code:`'1111111'`).
+
+    The joined holidays of a year are merged on first request into a cached bit mask,
+    so lookups do not depend on the number of calendars.
+    Masks are merged again if a :class:`BusinessHolidays` calendar has been modified.
+    """
+
+    JOINS = 'holidays', 'businessdays'
+
+    def __init__(self, calendars=(), join='holidays', iterable=()):
+        super(JointCalendar, self).__init__(iterable)
+        if join not in self.JOINS:
+            raise ValueError("join must be one of %s for %s" % (', '.join(self.JOINS), self.__class__.__name__))
+        self.calendars = tuple(calendars)
+        self.join = join
+        self.weekmask = (True,) * 7
+        self._masks = dict()
+        self._seen = BusinessHolidays._modifications
+        self._versions = self._calendar_versions()
+
+    def __reduce__(self):
+        return self.__class__, (self.calendars, self.join, list(self))
+
+    def __contains__(self, item):
+        if not self._seen == BusinessHolidays._modifications:
+            self._refresh()
+        mask = self._masks.get(item.year)
+        if mask is None:
+            mask = self._merge(item.year)
+        first, bits = mask
+        ordinal = item.toordinal() if isinstance(item, date) else date(item.year, item.month, item.day).toordinal()
+        return bool(bits >> (ordinal - first) & 1)
+
+    @property
+    def version(self):
+        if not self._seen == BusinessHolidays._modifications:
+            self._refresh()
+        return self._version
+
+    def business_day_index(self, days=None):
+        if not self._seen == BusinessHolidays._modifications:
+            self._refresh()
+        return super(JointCalendar, self).business_day_index(days)
+
+    def _workweek(self):
+        # weekend of any calendar is weekend if holidays are joined, else only weekend of all calendars
+        merge = all if self.join == 'holidays' else any
+        workweeks = [_workweek(calendar) for calendar in self.calendars]
+        return tuple(merge(flags) for flags in zip(*workweeks)) if workweeks else (True,) * 7
+
+    def _calendar_versions(self):
+        return tuple(getattr(calendar, 'version', None) for calendar in self.calendars)
+
+    def _refresh(self):
+        # check calendars for modifications after any calendar has been modified
+        self._seen = BusinessHolidays._modifications
+        versions = self._calendar_versions()
+        if not versions == self._versions:
+            self._versions = versions
+            self._changed(False)
+
+    def _changed(self, rebuild=True):
+        super(JointCalendar, self)._changed(rebuild)
+        # masks are merged again from calendars on request
+        self._masks = dict()
+
+    def _merge(self, year):
+        first, last = date(year, 1, 1).toordinal(), date(year, 12, 31).toordinal()
+        merge = any if self.join == 'holidays' else all
+        calendars, ordinals = self.calendars, self._ordinals
+        bits = 0
+        for ordinal in range(first, last + 1):
+            d = date.fromordinal(ordinal)
+            if ordinal in ordinals or calendars and merge(not is_business_day(d, c) for c in calendars):
+                bits |= 1 << (ordinal - first)
+        mask = first, bits
+        self._masks[year] = mask
+        return mask
+
+
+class TargetHolidays(RuleBasedHolidays):
     """ holiday calendar class of ecb target2 holidays
 
     Target holidays are
@@ -52,20 +612,15 @@ class TargetHolidays(BusinessHolidays):
     * December, 25th (Christmas Day)
     * December, 25th (Boxing Day)
 
+    Holidays are generated year by year as with :class:`RuleBasedHolidays`.
+
     """
 
-    def __contains__(self, item):
-        if not super(TargetHolidays, self).__contains__(date(item.year, 1, 1)):
-            # add tar days if not done jet
-
-            e = date(*easter(item.year))
-            target_days = dict()
-            target_days[date(item.year, 1, 1)] = "New Year's Day"
-            target_days[e - timedelta(2)] = "Black Friday"
-            target_days[e + timedelta(1)] = "Easter Monday"
-            target_days[date(item.year, 5, 1)] = "Labour Day"
-            target_days[date(item.year, 12, 25)] = "First Christmas Day"
-            target_days[date(item.year, 12, 26)] = "Second Christmas Day"
-
-            self.extend(list(target_days.keys()))
-        return super(TargetHolidays, self).__contains__(item)
+    RULES = (
+        FixedHoliday(1, 1, "New Year's Day"),
+        EasterHoliday(-2, "Black Friday"),
+        EasterHoliday(1, "Easter Monday"),
+        FixedHoliday(5, 1, "Labour Day"),
+        FixedHoliday(12, 25, "First Christmas Day"),
+        FixedHoliday(12, 26, "Second Christmas Day"),
+    )
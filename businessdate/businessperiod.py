@@ -13,10 +13,16 @@
 
 from datetime import timedelta
 
+from .lrucache import LRUCache
+
 
 class BusinessPeriod(object):
+    PARSE_CACHE = LRUCache(1024)
+    INTERNED = dict()
+
+    __slots__ = '_months', '_days', '_businessdays', '_key', '_hash'
 
-    def __init__(self, period='', years=0, quarters=0, months=0, weeks=0, days=0, businessdays=0):
+    def __new__(cls, period='', years=0, quarters=0, months=0, weeks=0, days=0, businessdays=0):
         """ class to store and calculate date periods as combinations of days, weeks, years etc.
 
         :param str period: encoding a business period.
@@ -30,6 +36,15 @@ class BusinessPeriod(object):
          business days **B**.
          E.g. **1Y2W3D** what gives a period of 1 year plus 2 weeks and 3 days
          (see :doc:`tutorial <tutorial>` for details).
+         Parsed strings are kept in the :class:`LRUCache <businessdate.lrucache.LRUCache>`
+         :code:`BusinessPeriod.PARSE_CACHE`, which offers statistics by :code:`info()`
+         and can be bounded by :code:`resize(maxsize)`.
+
+        :class:`BusinessPeriod` instances are immutable and hashable by value,
+        so they serve well as dictionary keys.
+        Common tenors like **3M** or **10Y** are interned
+        and :code:`BusinessPeriod('3M')` gives always the same instance
+        (see :meth:`BusinessPeriod.intern`).
 
         :param int years: number of years in the period (equivalent to 12 months)
         :param int quarters: number of quarters in the period (equivalent to 3 months)
@@ -44,58 +59,74 @@ class BusinessPeriod(object):
         """
         if period and any((years, months, days, businessdays)):
             raise ValueError(
-                "Either string or argument input only for %s" % self.__class__.__name__)
+                "Either string or argument input only for %s" % cls.__name__)
 
-        super(BusinessPeriod, self).__init__()
         if isinstance(period, BusinessPeriod):
-            years = period.years
-            months = period.months
-            days = period.days
-            businessdays = period.businessdays
+            if type(period) is cls:
+                # instances are immutable, so no need to copy
+                return period
+            months = period._months
+            days = period._days
+            businessdays = period._businessdays
         elif isinstance(period, timedelta):
             days = period.days
         elif period is None:
             pass
         elif isinstance(period, str):
-            if period.upper() == '':
-                pass
-            elif period.upper() == '0D':
-                pass
-            elif period.upper() == 'ON':
-                businessdays = 1
-            elif period.upper() == 'TN':
-                businessdays = 2
-            elif period.upper() == 'DD':
-                businessdays = 3
-            else:
-                s, y, q, m, w, d, f = BusinessPeriod._parse_ymd(period)
-                # no final businesdays allowed
-                if f:
-                    raise ValueError("Unable to parse %s as %s" % (period, self.__class__.__name__))
-                # except the first non vanishing of y,q,m,w,d must have positive sign
-                sgn = [int(x / abs(x)) for x in (y, q, m, w, d) if x]
-                if [x for x in sgn[1:] if x < 0]:
-                    raise ValueError(
-                        "Except at the beginning no signs allowed in %s as %s" % (str(period), self.__class__.__name__))
-                y, q, m, w, d = (abs(x) for x in (y, q, m, w, d))
-                # use sign of first non vanishing of y,q,m,w,d
-                sgn = sgn[0] if sgn else 1
-                businessdays, years, quarters, months, weeks, days = s, sgn * y, sgn * q, sgn * m, sgn * w, sgn * d
+            if period:
+                businessdays, years, quarters, months, weeks, days = cls._parse_period_str(period)
         else:
             raise TypeError(
                 "%s of Type %s not valid to create BusinessPeriod." %(str(period), period.__class__.__name__))
 
-        self._months = 12 * years + 3 * quarters + months
-        self._days = 7 * weeks + days
-        self._businessdays = businessdays
+        months = 12 * years + 3 * quarters + months
+        days = 7 * weeks + days
 
-        if businessdays and (self._months or self._days):
+        if cls is BusinessPeriod:
+            interned = BusinessPeriod.INTERNED.get((months, days, businessdays))
+            if interned is not None:
+                return interned
+
+        if businessdays and (months or days):
             raise ValueError(
-                "Either (years,months,days) or businessdays must be zero for %s" % self.__class__.__name__)
-        if self._months and not self._days / self._months >= 0:
-            ymd = self.years, self.months, self.days
+                "Either (years,months,days) or businessdays must be zero for %s" % cls.__name__)
+        if months and not days / months >= 0:
+            ymd = int(months / 12), months - 12 * int(months / 12), days
             raise ValueError(
-                "(years, months, days)=%s must have equal sign for %s" % (str(ymd), self.__class__.__name__))
+                "(years, months, days)=%s must have equal sign for %s" % (str(ymd), cls.__name__))
+
+        self = super(BusinessPeriod, cls).__new__(cls)
+        _set = super(BusinessPeriod, self).__setattr__
+        _set('_months', months)
+        _set('_days', days)
+        _set('_businessdays', businessdays)
+        # comparison key of periods without business days (see __cmp__)
+        _set('_key', months * 30.5 + days)
+        _set('_hash', hash((months, days, businessdays)))
+        return self
+
+    @classmethod
+    def intern(cls, period):
+        """ registers `period` as shared instance and returns it
+
+        :param period: :class:`BusinessPeriod` or anything :class:`BusinessPeriod` can be build from
+        :return: :class:`BusinessPeriod`
+
+        Once interned, :code:`BusinessPeriod('3M')` returns the very same instance
+        as any other :class:`BusinessPeriod` of the same value.
+        """
+        period = BusinessPeriod(period)
+        key = period._months, period._days, period._businessdays
+        return BusinessPeriod.INTERNED.setdefault(key, period)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("%s is immutable" % self.__class__.__name__)
+
+    def __delattr__(self, key):
+        raise AttributeError("%s is immutable" % self.__class__.__name__)
+
+    def __reduce__(self):
+        return self.__class__, ('', 0, 0, self._months, 0, self._days, self._businessdays)
 
     @property
     def years(self):
@@ -115,6 +146,41 @@ class BusinessPeriod(object):
 
     # --- validation and information methods ---------------------------------
 
+    @classmethod
+    def _parse_period_str(cls, period):
+        # returns (businessdays, years, quarters, months, weeks, days) using the PARSE_CACHE
+        cache = BusinessPeriod.PARSE_CACHE
+        parsed = cache.get(period)
+        if parsed is None:
+            parsed = cls._parse_period_str_uncached(period)
+            cache.set(period, parsed)
+        return parsed
+
+    @classmethod
+    def _parse_period_str_uncached(cls, period):
+        if period.upper() in ('', '0D'):
+            return 0, 0, 0, 0, 0, 0
+        if period.upper() == 'ON':
+            return 1, 0, 0, 0, 0, 0
+        if period.upper() == 'TN':
+            return 2, 0, 0, 0, 0, 0
+        if period.upper() == 'DD':
+            return 3, 0, 0, 0, 0, 0
+
+        s, y, q, m, w, d, f = cls._parse_ymd(period)
+        # no final businesdays allowed
+        if f:
+            raise ValueError("Unable to parse %s as %s" % (period, cls.__name__))
+        # except the first non vanishing of y,q,m,w,d must have positive sign
+        sgn = [int(x / abs(x)) for x in (y, q, m, w, d) if x]
+        if [x for x in sgn[1:] if x < 0]:
+            raise ValueError(
+                "Except at the beginning no signs allowed in %s as %s" % (str(period), cls.__name__))
+        y, q, m, w, d = (abs(x) for x in (y, q, m, w, d))
+        # use sign of first non vanishing of y,q,m,w,d
+        sgn = sgn[0] if sgn else 1
+        return s, sgn * y, sgn * q, sgn * m, sgn * w, sgn * d
+
     @classmethod
     def _parse_ymd(cls, period):
         # can even parse strings like '-1B-2Y-4Q+5M' but also '0B', '-1Y2M3D' as well.
@@ -164,6 +230,8 @@ class BusinessPeriod(object):
         if period in ('', '0D', 'ON', 'TN', 'DD'):
             return True
         if isinstance(period, str):
+            if period in BusinessPeriod.PARSE_CACHE:
+                return True
             if period.isdigit():
                 return False
             #if period.upper().strip('+-0123456789BYQMWD'):
@@ -202,28 +270,27 @@ class BusinessPeriod(object):
         y,m,d,b = tuple(map(abs, ymdb))
         return self.__class__(years=y, months=m, days=d, businessdays=b)
 
-    def __cmp__(self, other):
-        other = self.__class__() if other == 0 else other
+    def __cmp__(self, other, days=0):
+        # compares with other plus days, returns None if not comparable
         if not isinstance(other, BusinessPeriod):
-            other = BusinessPeriod(other)
-        if self.businessdays:
-            if other and not other.businessdays:
+            other = self.__class__() if other == 0 else BusinessPeriod(other)
+        if self._businessdays:
+            if other and not other._businessdays:
                 # log warning on non compatible pair
                 return None
-            return self.businessdays - other.businessdays
-        m = 12 * (self.years - other.years) + self.months - other.months
-        d = self.days - other.days
+            return self._businessdays - other._businessdays
+        m = self._months - other._months
+        d = self._days - other._days - days
         if m * 28 < -d < m * 31:
-            p = self.__class__(months=m)
-            if p.min_days() <= -d <= p.max_days():
+            if _min_days(m, 0) <= -d <= _max_days(m, 0):
                 # log warning on non orderable pair
                 return None
-        return m * 30.5 + d
+        return self._key - other._key - days
 
     def __eq__(self, other):
         if isinstance(other, type(self)):
-            attr = 'years', 'months', 'days', 'businessdays'
-            return all(getattr(self, a) == getattr(other, a) for a in attr)
+            return self._months == other._months and self._days == other._days \
+                and self._businessdays == other._businessdays
         return False
 
     def __ne__(self, other):
@@ -231,7 +298,7 @@ class BusinessPeriod(object):
 
     def __le__(self, other):
         cmp = self.__cmp__(other)
-        cmp = self.__cmp__(other + '1D') if cmp is None else cmp
+        cmp = self.__cmp__(other, 1) if cmp is None else cmp
         return cmp if cmp is None else cmp <= 0
 
     def __lt__(self, other):
@@ -247,7 +314,7 @@ class BusinessPeriod(object):
         return None if le is None else not le
 
     def __hash__(self):
-        return hash(repr(self))
+        return self._hash
 
     def __nonzero__(self):
         # return any((self.years, self.months, self.days, self.businessdays))
@@ -290,30 +357,40 @@ class BusinessPeriod(object):
         return self.__mul__(other)
 
     def max_days(self):
-        if self._months < 0:
-            sgn = -1
-            days_in_month = 31, 30, 31, 30, 31, 31, 30, 31, 30, 31, 31, 28  # days from mar to feb forwards
-        else:
-            sgn = 1
-            days_in_month = 31, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31, 28
-        m = sgn * self._months
-        # days from jan to feb backwards
-        days = 0
-        for i in range(m):
-            days += days_in_month[int(i % 12)]
-            days += 1 if int(i % 48) == 11 else 0
-        return sgn * days + self._days
+        """ returns the maximal number of days the period can span """
+        return _max_days(self._months, self._days)
 
     def min_days(self):
-        if self._months < 0 :
-            sgn = -1
-            days_in_month = 28, 31, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31 # days from feb to jan backwards
-        else:
-            sgn = 1
-            days_in_month = 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31, 31 # days from feb to jan forwards
-        m  = sgn * self._months
-        days = 0
-        for i in range(m):
-            days += days_in_month[int(i % 12)]
-            days += 1 if int(i % 48) == 36 else 0
-        return sgn * days + self._days
+        """ returns the minimal number of days the period can span """
+        return _min_days(self._months, self._days)
+
+
+# cumulated days of months (from jan forwards or from mar backwards) starting with most days
+_MAX_DAYS_FORWARD = 0, 31, 62, 92, 123, 153, 184, 215, 245, 276, 306, 337
+_MAX_DAYS_BACKWARD = 0, 31, 61, 92, 122, 153, 184, 214, 245, 275, 306, 337
+# cumulated days of months (from feb forwards or from feb backwards) starting with least days
+_MIN_DAYS_FORWARD = 0, 28, 59, 89, 120, 150, 181, 212, 242, 273, 303, 334
+_MIN_DAYS_BACKWARD = 0, 28, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334
+
+
+def _max_days(months, days):
+    # maximal days of months plus days, i.e. starting at the longest months incl. leap day in each 4 years
+    sgn, cum = (-1, _MAX_DAYS_BACKWARD) if months < 0 else (1, _MAX_DAYS_FORWARD)
+    m = sgn * months
+    return sgn * (m // 12 * 365 + cum[m % 12] + (m + 36) // 48) + days
+
+
+def _min_days(months, days):
+    # minimal days of months plus days, i.e. starting at the shortest months and with leap day as late as possible
+    sgn, cum = (-1, _MIN_DAYS_BACKWARD) if months < 0 else (1, _MIN_DAYS_FORWARD)
+    m = sgn * months
+    return sgn * (m // 12 * 365 + cum[m % 12] + (m + 11) // 48) + days
+
+
+# common tenors shared by all BusinessPeriod('...') calls of the same value
+for _tenor in ('0D', 'ON', 'TN', 'DD', '1B', '2B', '-1B', '-2B', '1D', '1W', '2W', '3W',
+               '1M', '2M', '3M', '4M', '5M', '6M', '7M', '8M', '9M', '10M', '11M', '12M', '15M', '18M', '21M',
+               '1Y', '2Y', '3Y', '4Y', '5Y', '6Y', '7Y', '8Y', '9Y', '10Y',
+               '12Y', '15Y', '20Y', '25Y', '30Y', '40Y', '50Y'):
+    BusinessPeriod.intern(_tenor)
+del _tenor
@@ -11,10 +11,53 @@
 # License:  Apache License 2.0 (see LICENSE file)
 
 
+from datetime import date
+
+from .ymd import days_in_month
 from .businessperiod import BusinessPeriod
 from .businessdate import BusinessDate
 
 
+class _Grid(object):
+    """ infinite grid of ordinals given by `rolling` plus multiples of `step` """
+
+    def __init__(self, step, rolling):
+        if not step:
+            raise ValueError("step of %s must not be zero" % BusinessRange.__name__)
+
+        # turn step into positive direction
+        step = step if rolling <= rolling + step else -1 * step
+        self.step, self.rolling = step, rolling
+        self.origin = rolling.to_date().toordinal()
+        self.businessdays = step.businessdays
+        self._ymd = rolling.year, rolling.month - 1, rolling.day
+        self._average = step._months * 30.436875 + step._days
+
+    def __call__(self, i):
+        """ ordinal of grid point `i` """
+        if self.businessdays:
+            return self.rolling._add_business_days(i * self.businessdays).to_date().toordinal()
+        # rolling plus i * months (rolling day capped by month end) plus i * days
+        y, m, d = self._ymd
+        yy, mm = divmod(m + i * self.step._months, 12)
+        yy += y
+        return date(yy, mm + 1, min(d, days_in_month(yy, mm + 1))).toordinal() + i * self.step._days
+
+    def index(self, d):
+        """ first index `i` of grid point not before date `d` """
+        ordinal = d.to_date().toordinal() if hasattr(d, 'to_date') else d.toordinal()
+        # estimate index and correct estimate
+        if self.businessdays:
+            i = self.rolling.diff_in_business_days(date.fromordinal(ordinal)) // self.businessdays
+        else:
+            i = int((ordinal - self.origin) // self._average)
+        while ordinal <= self(i):
+            i -= 1
+        while self(i + 1) < ordinal:
+            i += 1
+        return i + 1
+
+
 class BusinessRange(list):
     def __init__(self, start, stop=None, step=None, rolling=None):
         """ class to build list of business days
@@ -41,9 +84,8 @@ class BusinessRange(list):
         start, stop, step, rolling = self._default_args(start, stop, step, rolling)
         schedule = self._build_grid(start, stop, step, rolling)
 
-        # push to super and sort
-        super(BusinessRange, self).__init__(set(schedule))
-        self.sort()
+        # push to super (grid is already sorted)
+        super(BusinessRange, self).__init__(schedule)
 
     @staticmethod
     def _default_args(start, stop, step, rolling):
@@ -63,24 +105,32 @@ class BusinessRange(list):
 
     @staticmethod
     def _build_grid(start, stop, step, rolling):
-        # setup grid and turn step into positive direction
-        grid = list()
-        step = step if rolling <= rolling + step else -1 * step
+        grid = _Grid(step, rolling)
+        if grid.businessdays:
+            return BusinessRange._build_business_days_grid(grid, start, stop)
 
-        # roll backward before start
-        i = 0
-        while start <= rolling + step * i:
-            i -= 1
+        # fill grid from start until stop (grid is strictly increasing)
+        i, last = grid.index(start), stop.to_date().toordinal()
+        points = list()
+        current = grid(i)
+        while current < last:
+            points.append(current)
+            i += 1
+            current = grid(i)
+        return BusinessDate.from_ordinals(points)
 
-        # fill grid from start until end
-        current = rolling + step * i
+    @staticmethod
+    def _build_business_days_grid(grid, start, stop):
+        # fill grid from start until stop by stepping from previous grid point
+        i = grid.index(start)
+        current = BusinessDate(date.fromordinal(grid(i)))
+        points = list()
         while current < stop:
-            if start <= current < stop:
-                grid.append(current)
+            points.append(current)
             i += 1
-            current = rolling + step * i
-
-        return grid
+            # grid point 0 is rolling even if rolling is not a business day
+            current = grid.rolling if i == 0 else current._add_business_days(grid.businessdays)
+        return points
 
     def adjust(self, convention='', holidays=None):
         """ returns adjusted :class:`BusinessRange` following given convention
@@ -96,3 +146,112 @@ class BusinessRange(list):
         del self[:]
         super(BusinessRange, self).extend(adj_list)
         return self
+
+
+class LazyBusinessRange(object):
+    def __init__(self, start, stop=None, step=None, rolling=None):
+        """ lazy version of :class:`BusinessRange` behaving like :class:`range`
+
+        :param BusinessDate start: date to begin schedule,
+         if stop not given, start will be used as stop and
+         default in rolling to :class:`BusinessDate() <BusinessDate>`
+        :param BusinessDate stop: date to stop before,
+         if not given, start will be used for stop instead
+        :param BusinessPeriod step: period to step schedule,
+         if not given 1 day is default
+        :param BusinessDate rolling: date to roll on
+         (forward and backward) between start and stop,
+         if not given default will be start
+
+        Dates are calculated on access only,
+        so `len`, indexing, slicing, `in` and `reversed` do not
+        need to build all dates of the range.
+        Use :meth:`LazyBusinessRange.adjust` for a view of adjusted dates.
+
+        """
+        start, stop, step, rolling = BusinessRange._default_args(start, stop, step, rolling)
+        self._grid = _Grid(step, rolling)
+        first = self._grid.index(start)
+        self._indices = range(first, max(first, self._grid.index(stop)))
+        self._convention = None
+        self._holidays = None
+
+    def _view(self, indices, convention=None, holidays=None):
+        view = self.__class__.__new__(self.__class__)
+        view._grid = self._grid
+        view._indices = indices
+        view._convention = convention
+        view._holidays = holidays
+        return view
+
+    def _date(self, i):
+        d = BusinessDate(date.fromordinal(self._grid(i)))
+        if self._convention is not None:
+            d = d.adjust(self._convention, self._holidays)
+        return d
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self._view(self._indices[item], self._convention, self._holidays)
+        return self._date(self._indices[item])
+
+    def __iter__(self):
+        return (self._date(i) for i in self._indices)
+
+    def __reversed__(self):
+        return (self._date(i) for i in reversed(self._indices))
+
+    def __contains__(self, item):
+        return self._position(item) is not None
+
+    def __eq__(self, other):
+        if isinstance(other, LazyBusinessRange):
+            other = list(other)
+        return isinstance(other, (list, tuple)) and list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return self.__class__.__name__ + '(%s)' % ', '.join(str(d) for d in self)
+
+    def _position(self, item):
+        if not BusinessDate.is_businessdate(item):
+            return None
+        d = BusinessDate(item)
+        if self._convention is None:
+            # grid points are strictly increasing
+            i = self._grid.index(d)
+            if self._grid(i) == d.to_date().toordinal() and i in self._indices:
+                return self._indices.index(i)
+            return None
+        # adjusted dates are monotonic, so search by bisection
+        lo, hi = 0, len(self)
+        # indices are a list on Python 2, so direction is not taken from range.step
+        sgn = -1 if 1 < len(self) and self._indices[-1] < self._indices[0] else 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if sgn * self._date(self._indices[mid]).diff_in_days(d) > 0:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self) and self[lo] == d:
+            return lo
+        return None
+
+    def index(self, item):
+        """ returns position of `item` in range """
+        position = self._position(item)
+        if position is None:
+            raise ValueError("%s is not in %s" % (str(item), self.__class__.__name__))
+        return position
+
+    def adjust(self, convention='', holidays=None):
+        """ returns view of adjusted dates following given convention
+
+        For details of adjusting :class:`BusinessDate` see :meth:`BusinessDate.adjust`.
+        """
+        return self._view(self._indices, convention, holidays)
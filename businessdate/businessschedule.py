@@ -33,11 +33,13 @@ class BusinessSchedule(BusinessRange):
         """
         roll = roll if roll else end
         start, end = list(map(BusinessDate, (start, end)))
-        super(BusinessSchedule, self).__init__(start, end, step, roll)
-        if start not in self:
-            self.insert(0, start)
-        if end not in self:
-            self.append(end)
+        grid = self._build_grid(*self._default_args(start, end, step, roll))
+        # grid is sorted and sliced by start (incl.) and end (excl.)
+        schedule = list() if grid and grid[0] == start else [start]
+        schedule.extend(grid)
+        if not schedule[-1] == end:
+            schedule.append(end)
+        super(BusinessRange, self).__init__(schedule)
 
     def first_stub_long(self):
         """ adjusts the schedule to have a long stub at the beginning,
@@ -54,3 +56,74 @@ class BusinessSchedule(BusinessRange):
         if len(self) > 2:
             self.pop(-2)
         return self
+
+
+class CashFlowSchedule(object):
+    def __init__(self, start, end, step, roll=None, first_stub_long=False, last_stub_long=False,
+                 convention='', day_count='', holidays=None, payment_lag=0):
+        """ class to build columns of accrual periods and payment dates of a schedule
+
+        :param BusinessDate start: start date of schedule
+        :param BusinessDate end: end date of schedule
+        :param BusinessPeriod step: period distance of two dates
+        :param BusinessDate roll: origin of schedule (default: `end`)
+        :param bool first_stub_long: long stub at the beginning
+         (see :meth:`BusinessSchedule.first_stub_long`, default: `False`)
+        :param bool last_stub_long: long stub at the end
+         (see :meth:`BusinessSchedule.last_stub_long`, default: `False`)
+        :param str convention: business day adjustment convention
+         (see :meth:`BusinessDate.adjust`, default: :attr:`BusinessDate.ADJUST`)
+        :param str day_count: day count convention
+         (see :meth:`BusinessDate.get_day_count`, default: :attr:`BusinessDate.DAY_COUNT`)
+        :param holidays: holidays (default: :attr:`BusinessDate.DEFAULT_HOLIDAYS`)
+        :param int payment_lag: number of business days from adjusted accrual end to payment
+
+        Builds the :class:`BusinessSchedule` and calculates in one pass the columns
+
+        * **unadjusted_dates** the schedule dates
+        * **adjusted_dates** the schedule dates adjusted by `convention`
+        * **start_dates** adjusted accrual start of each period
+        * **end_dates** adjusted accrual end of each period
+        * **payment_dates** payment date of each period
+        * **year_fractions** accrual year fraction of each period following `day_count`
+
+        as :class:`tuple`. Rows of a period are given by iteration.
+        """
+        schedule = BusinessSchedule(start, end, step, roll)
+        if first_stub_long:
+            schedule.first_stub_long()
+        if last_stub_long:
+            schedule.last_stub_long()
+
+        convention = convention if convention else BusinessDate.ADJUST
+        day_count = day_count if day_count else BusinessDate.DAY_COUNT
+        holidays = BusinessDate.DEFAULT_HOLIDAYS if holidays is None else holidays
+        adj_func = BusinessDate._adjust_function(convention)
+        dc_func = BusinessDate._day_count_function(day_count)
+
+        adjusted, year_fractions, payment_dates = list(), list(), list()
+        previous = None
+        for d in schedule:
+            a = BusinessDate(adj_func(d.to_date(), holidays))
+            if previous is not None:
+                year_fractions.append(dc_func(previous.to_date(), a.to_date()))
+                payment_dates.append(a._add_business_days(payment_lag, holidays) if payment_lag else a)
+            adjusted.append(a)
+            previous = a
+
+        self.unadjusted_dates = tuple(schedule)
+        self.adjusted_dates = tuple(adjusted)
+        self.start_dates = self.adjusted_dates[:-1]
+        self.end_dates = self.adjusted_dates[1:]
+        self.payment_dates = tuple(payment_dates)
+        self.year_fractions = tuple(year_fractions)
+
+    def __len__(self):
+        return len(self.year_fractions)
+
+    def __iter__(self):
+        return iter(zip(self.start_dates, self.end_dates, self.payment_dates, self.year_fractions))
+
+    def __repr__(self):
+        return self.__class__.__name__ + '(%s, %s, %d periods)' % (
+            str(self.unadjusted_dates[0]), str(self.unadjusted_dates[-1]), len(self))
@@ -14,18 +14,36 @@
 from calendar import WEDNESDAY, FRIDAY
 from datetime import date, timedelta
 from .ymd import days_in_month, end_of_quarter_month
+from . import instrumentation
 
 ONE_DAY = timedelta(1)
 
 
 def is_business_day(business_date, holidays=list()):
-    """ method to check if a date falls neither on weekend nor is in holidays. """
-
-    if business_date.weekday() > FRIDAY:
+    """ method to check if a date falls neither on weekend nor is in holidays.
+
+    Weekend days are Saturday and Sunday
+    unless `holidays` has an attribute `weekmask`
+    giving seven flags from Monday to Sunday for days which are not weekend.
+    """
+    weekmask = getattr(holidays, 'weekmask', None)
+    if weekmask is None:
+        if business_date.weekday() > FRIDAY:
+            return False
+    elif not weekmask[business_date.weekday()]:
         return False
     return business_date not in holidays
 
 
+def _business_day_index(business_date, holidays):
+    # returns BusinessDayIndex of holidays if present (or worth building) and business_date is covered
+    business_day_index = getattr(holidays, 'business_day_index', None)
+    if business_day_index is None or not isinstance(business_date, date):
+        return None
+    index = business_day_index(1)
+    return index if index is not None and business_date.toordinal() in index else None
+
+
 def adjust_no(business_date, holidays=()):
     """ does no adjustment. """
     return business_date
@@ -33,15 +51,35 @@ def adjust_no(business_date, holidays=()):
 
 def adjust_previous(business_date, holidays=()):
     """ adjusts to Business Day Convention "Preceding". """
+    index = _business_day_index(business_date, holidays)
+    if index is not None:
+        ordinal = business_date.toordinal()
+        previous = index.previous(ordinal)
+        if previous is not None:
+            return business_date if previous == ordinal else business_date - ONE_DAY * (ordinal - previous)
+    steps = 0
     while not is_business_day(business_date, holidays):
         business_date -= ONE_DAY
+        steps += 1
+    if instrumentation.ENABLED:
+        instrumentation.count('adjust day steps', steps)
     return business_date
 
 
 def adjust_follow(business_date, holidays=()):
     """ adjusts to Business Day Convention "Following". """
+    index = _business_day_index(business_date, holidays)
+    if index is not None:
+        ordinal = business_date.toordinal()
+        follow = index.follow(ordinal)
+        if follow is not None:
+            return business_date if follow == ordinal else business_date + ONE_DAY * (follow - ordinal)
+    steps = 0
     while not is_business_day(business_date, holidays):
         business_date += ONE_DAY
+        steps += 1
+    if instrumentation.ENABLED:
+        instrumentation.count('adjust day steps', steps)
     return business_date
 
 
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+# businessdate
+# ------------
+# Python library for generating business dates for fast date operations
+# and rich functionality.
+#
+# Author:   sonntagsgesicht, based on a fork of Deutsche Postbank [pbrisk]
+# Version:  0.5, copyright Wednesday, 18 September 2019
+# Website:  https://github.com/sonntagsgesicht/businessdate
+# License:  Apache License 2.0 (see LICENSE file)
+
+
+import re
+from datetime import datetime
+
+from .businessperiod import BusinessPeriod
+from .lrucache import LRUCache
+
+
+class DateExpression(object):
+    """ parsed complex date string like **0B1D2BMOD20191231**, **3Y2M1D** or **-2B**
+
+    A date expression consists of (all parts are optional)
+
+        * a **spot** period in business days, e.g. **0B**,
+        * a **period** of years, quarters, months, weeks and days, e.g. **1Y2M**,
+        * a **final** period in business days, e.g. **2B**,
+        * a business day **convention**, e.g. **MOD**, which applies before spot and final,
+        * an **origin** date of format **YYYYMMDD**, e.g. **20191231**.
+
+    Parsing is done by a precompiled regular expression
+    and parsed expressions are kept in :code:`DateExpression.PARSE_CACHE`,
+    so :meth:`DateExpression.parse` returns the very same instance for the same string.
+    Results of :meth:`DateExpression.evaluate` are memoized per origin and
+    :class:`BusinessHolidays` calendar (keeping up to :code:`DateExpression.MEMO_SIZE` results).
+    """
+
+    PARSE_CACHE = LRUCache(1024)
+    MEMO_SIZE = 64
+
+    # long unit names (as accepted by BusinessPeriod) following a number are reduced to their initial
+    _UNITS = re.compile(r'(?<=[0-9])(BUSINESSDAYS|YEARS|QUARTERS|MONTHS|WEEKS|DAYS)')
+    # leading period shortcuts (as accepted by BusinessPeriod), e.g. ON20191231 or TNFOLLOW
+    _ALIAS = re.compile(r'^(ON|TN|DD)')
+
+    _conventions = ()
+    _grammar = None
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.spot, self.period, self.final, self.convention, self.origin = self._parse(expression)
+        self._memo = LRUCache(self.__class__.MEMO_SIZE)
+
+    @classmethod
+    def set_conventions(cls, conventions):
+        """ compiles grammar for the given business day convention keys and clears parse cache """
+        cls._conventions = tuple(sorted(set(c.upper() for c in conventions), key=len, reverse=True))
+        pattern = '|'.join(re.escape(c) for c in cls._conventions)
+        cls._grammar = re.compile(
+            r'^(?P<body>[0-9+\-BYQMWD]*?)(?P<convention>%s)?(?P<origin>[0-9]{8})?$' % pattern)
+        cls.PARSE_CACHE.clear()
+
+    @classmethod
+    def parse(cls, expression):
+        """ returns (cached) :class:`DateExpression` of the string `expression` """
+        cache = cls.PARSE_CACHE
+        expr = cache.get(expression)
+        if expr is None:
+            expr = cls(expression)
+            cache.set(expression, expr)
+        return expr
+
+    @classmethod
+    def _parse(cls, expression):
+        date_str = str(expression).upper().replace(' ', '')
+        date_str = cls._UNITS.sub(lambda unit: unit.group(0)[0], date_str)
+        alias = cls._ALIAS.match(date_str)
+        if alias:
+            alias, date_str = alias.group(0), date_str[len(alias.group(0)):]
+
+        match = cls._grammar.match(date_str) if cls._grammar else None
+        if match is None or alias and match.group('body'):
+            raise ValueError("Unable to parse %s as %s" % (expression, cls.__name__))
+        body, convention, origin = match.group('body', 'convention', 'origin')
+
+        # an origin requires some leading expression
+        if origin and not (alias or body or convention):
+            body, origin = origin, None
+        if origin:
+            try:
+                datetime.strptime(origin, '%Y%m%d')
+            except ValueError:
+                raise ValueError("Unable to parse origin %s in %s as %s" % (origin, expression, cls.__name__))
+        convention = convention.lower() if convention else None
+        if alias:
+            # shortcut is the period, so no convention applies before
+            return None, BusinessPeriod(alias), None, convention, origin
+        body = body if body else '0B'
+
+        # split into spot, period and final
+        pfields = body.strip('0123456789+-B')
+        spot, period, final = body, '', ''
+        if pfields:
+            spot, period, final = '', '', ''
+            x = pfields[-1]
+            period, final = body.split(x, 1)
+            period += x
+            if period.find('B') >= 0:
+                spot, period = period.split('B', 1)
+                spot += 'B'
+
+        spot, period, final = (BusinessPeriod(p) if p else None for p in (spot, period, final))
+        return spot, period, final, convention, origin
+
+    def __repr__(self):
+        return self.__class__.__name__ + "('%s')" % self.expression
+
+    def __str__(self):
+        return str(self.expression)
+
+    def evaluate(self, origin=None, holidays=None):
+        """ evaluates expression
+
+        :param origin: date to start from
+         (default: origin given in expression or else :class:`BusinessDate` default)
+        :param holidays: holidays (default: :code:`BusinessDate.DEFAULT_HOLIDAYS`)
+        :return: :class:`BusinessDate`
+
+        Results are memoized for :class:`BusinessHolidays` (or none) `holidays`
+        until the calendar is modified.
+        """
+        from .businessdate import BusinessDate, _BusinessDate
+        if not isinstance(origin, _BusinessDate):
+            origin = BusinessDate(origin if origin is not None else int(self.origin) if self.origin else None)
+
+        calendar = origin.DEFAULT_HOLIDAYS if holidays is None else holidays
+        version = getattr(calendar, 'version', None)
+        if version is None:
+            return self._evaluate(origin, holidays)
+
+        key = origin.__class__, origin, id(calendar), version
+        cached = self._memo.get(key)
+        if cached is not None and cached[0] is calendar:
+            return cached[1]
+        res = self._evaluate(origin, holidays)
+        self._memo.set(key, (calendar, res))
+        return res
+
+    def _evaluate(self, origin, holidays=None):
+        res = origin
+        if self.spot is not None:
+            if self.convention:
+                res = res.adjust(self.convention, holidays)
+            res = res.add_period(self.spot, holidays)
+        if self.period is not None:
+            res = res.add_period(self.period, holidays)
+        if self.final is not None:
+            if self.convention:
+                res = res.adjust(self.convention, holidays)
+            res = res.add_period(self.final, holidays)
+        return res
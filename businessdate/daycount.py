@@ -12,7 +12,12 @@
 
 
 from datetime import date
-from .ymd import is_leap_year
+from .ymd import is_leap_year, from_excel_to_ymd_array, from_ymd_to_excel_array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 def diff_in_days(start, end):
@@ -90,3 +95,102 @@ def get_act_act(start, end):
 
     return years_in_between + rest_year1 / (366.0 if is_leap_year(start.year) else 365.0) + rest_year2 / (
         366.0 if is_leap_year(end.year) else 365.0)
+
+
+# --- array versions ----------------------------------------------------------
+#
+# Array versions take dates either as array of int in Microsoft Excel representation
+# (see :func:`businessdate.ymd.from_ymd_to_excel`) or
+# as :class:`tuple` of arrays `(year, month, day)`
+# and return a :class:`numpy.ndarray` of float.
+# They give element by element exactly the same result as their scalar counterpart.
+
+
+def _ymd_days_array(dates):
+    # returns year, month, day and a day number counting real days (jumping the excel 29.2.1900)
+    if isinstance(dates, tuple):
+        year, month, day = (np.asarray(x, dtype=np.int64) for x in dates)
+        excel = from_ymd_to_excel_array(year, month, day)
+    else:
+        excel = np.asarray(dates, dtype=np.int64)
+        year, month, day = from_excel_to_ymd_array(excel)
+    return year, month, day, excel + (excel <= 60)
+
+
+def _is_leap_year_array(year):
+    return (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+
+def diff_in_days_array(start, end):
+    """ array version of :func:`diff_in_days` """
+    return (_ymd_days_array(end)[3] - _ymd_days_array(start)[3]).astype(float)
+
+
+def get_30_360_array(start, end):
+    """ array version of :func:`get_30_360` """
+    y1, m1, d1, _ = _ymd_days_array(start)
+    y2, m2, d2, _ = _ymd_days_array(end)
+    d1 = np.minimum(d1, 30)
+    d2 = np.where((d1 == 30) & (d2 == 31), 30, d2)
+    return (360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)) / 360.0
+
+
+def get_30e_360_array(start, end):
+    """ array version of :func:`get_30e_360` """
+    y1, m1, d1, _ = _ymd_days_array(start)
+    y2, m2, d2, _ = _ymd_days_array(end)
+    d1 = np.minimum(d1, 30)
+    d2 = np.minimum(d2, 30)
+    return (360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)) / 360.0
+
+
+def get_30e_360i_array(start, end):
+    """ array version of :func:`get_30e_360i` """
+    y1, m1, d1, _ = _ymd_days_array(start)
+    y2, m2, d2, _ = _ymd_days_array(end)
+    d1 = np.where(((m1 == 2) & (d1 >= 28)) | (d1 == 31), 30, d1)
+    d2 = np.where(((m2 == 2) & (d2 >= 28)) | (d2 == 31), 30, d2)
+    return (360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)) / 360.0
+
+
+def get_act_360_array(start, end):
+    """ array version of :func:`get_act_360` """
+    return diff_in_days_array(start, end) / 360.0
+
+
+def get_act_365_array(start, end):
+    """ array version of :func:`get_act_365` """
+    return diff_in_days_array(start, end) / 365.0
+
+
+def get_act_36525_array(start, end):
+    """ array version of :func:`get_act_36525` """
+    return diff_in_days_array(start, end) / 365.25
+
+
+def get_act_act_array(start, end):
+    """ array version of :func:`get_act_act` """
+    y1, _, _, days1 = _ymd_days_array(start)
+    y2, _, _, days2 = _ymd_days_array(end)
+    basis1 = np.where(_is_leap_year_array(y1), 366.0, 365.0)
+    basis2 = np.where(_is_leap_year_array(y2), 366.0, 365.0)
+    diff = (days2 - days1).astype(float)
+
+    # see get_act_act for the split into start year, years in between and end year
+    rest_year1 = (_ymd_days_array((y1, 12, 31))[3] - days1).astype(float) + 1
+    rest_year2 = np.abs((_ymd_days_array((y2, 1, 1))[3] - days2).astype(float))
+    years_in_between = y2 - y1 - 1
+
+    return np.where(y1 == y2, diff / basis1, years_in_between + rest_year1 / basis1 + rest_year2 / basis2)
+
+
+#: dict: scalar day count function to its array version
+_array_func = {
+    get_30_360: get_30_360_array,
+    get_30e_360: get_30e_360_array,
+    get_30e_360i: get_30e_360i_array,
+    get_act_360: get_act_360_array,
+    get_act_365: get_act_365_array,
+    get_act_36525: get_act_36525_array,
+    get_act_act: get_act_act_array,
+}
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+# businessdate
+# ------------
+# Python library for generating business dates for fast date operations
+# and rich functionality.
+#
+# Author:   sonntagsgesicht, based on a fork of Deutsche Postbank [pbrisk]
+# Version:  0.5, copyright Wednesday, 18 September 2019
+# Website:  https://github.com/sonntagsgesicht/businessdate
+# License:  Apache License 2.0 (see LICENSE file)
+
+
+from calendar import SATURDAY, SUNDAY
+from datetime import date, timedelta
+
+from .ymd import easter, days_in_month
+
+
+# --- observance functions ---------------------------------------------------
+
+
+def sunday_to_monday(d):
+    """ moves a holiday on Sunday to the following Monday """
+    return d + timedelta(1) if d.weekday() == SUNDAY else d
+
+
+def weekend_to_monday(d):
+    """ moves a holiday on Saturday or Sunday to the following Monday """
+    return d + timedelta(7 - d.weekday()) if d.weekday() >= SATURDAY else d
+
+
+def nearest_weekday(d):
+    """ moves a holiday on Saturday to the Friday before and on Sunday to the following Monday """
+    if d.weekday() == SATURDAY:
+        return d - timedelta(1)
+    return sunday_to_monday(d)
+
+
+# --- holiday rules ----------------------------------------------------------
+
+
+class HolidayRule(object):
+    """ base class of rules giving holidays of a year
+
+    :param str name: name of the holiday
+    :param observance: function to shift the holiday, e.g. if it falls on weekend
+     (see :func:`sunday_to_monday`, :func:`weekend_to_monday` and :func:`nearest_weekday`)
+    :param int start_year: first year the rule applies (optional)
+    :param int end_year: last year the rule applies (optional)
+    """
+
+    def __init__(self, name='', observance=None, start_year=None, end_year=None):
+        self.name = name
+        self.observance = observance
+        self.start_year = start_year
+        self.end_year = end_year
+
+    def __repr__(self):
+        return self.__class__.__name__ + "('%s')" % self.name
+
+    def _date(self, year):
+        raise NotImplementedError
+
+    def dates(self, year):
+        """ returns :class:`list` of holidays of `year` given by the rule """
+        if self.start_year is not None and year < self.start_year:
+            return []
+        if self.end_year is not None and self.end_year < year:
+            return []
+        d = self._date(year)
+        if self.observance is not None:
+            d = self.observance(d)
+        return [d]
+
+
+class FixedHoliday(HolidayRule):
+    """ holiday on the same day every year, e.g. :code:`FixedHoliday(12, 25, 'Christmas Day')`
+
+    :param int month: month of the holiday
+    :param int day: day of the holiday
+    """
+
+    def __init__(self, month, day, name='', observance=None, start_year=None, end_year=None):
+        super(FixedHoliday, self).__init__(name, observance, start_year, end_year)
+        self.month = month
+        self.day = day
+
+    def _date(self, year):
+        return date(year, self.month, self.day)
+
+
+class EasterHoliday(HolidayRule):
+    """ holiday relative to Easter Sunday, e.g. :code:`EasterHoliday(-2, 'Good Friday')`
+
+    :param int offset: number of days after Easter Sunday (negative for days before)
+    """
+
+    def __init__(self, offset=0, name='', observance=None, start_year=None, end_year=None):
+        super(EasterHoliday, self).__init__(name, observance, start_year, end_year)
+        self.offset = offset
+
+    def _date(self, year):
+        return date(*easter(year)) + timedelta(self.offset)
+
+
+class WeekdayHoliday(HolidayRule):
+    """ holiday on the n-th weekday of a month, e.g. :code:`WeekdayHoliday(5, MONDAY, -1, 'Memorial Day')`
+
+    :param int month: month of the holiday
+    :param int weekday: weekday of the holiday (Monday is 0 and Sunday is 6)
+    :param int n: number of the weekday in the month (negative to count from the month end)
+    """
+
+    def __init__(self, month, weekday, n=1, name='', observance=None, start_year=None, end_year=None):
+        super(WeekdayHoliday, self).__init__(name, observance, start_year, end_year)
+        if not n:
+            raise ValueError("n must not be zero for %s" % self.__class__.__name__)
+        self.month = month
+        self.weekday = weekday
+        self.n = n
+
+    def _date(self, year):
+        if 0 < self.n:
+            first = date(year, self.month, 1)
+            return first + timedelta((self.weekday - first.weekday()) % 7 + 7 * (self.n - 1))
+        last = date(year, self.month, days_in_month(year, self.month))
+        return last - timedelta((last.weekday() - self.weekday) % 7 + 7 * (-self.n - 1))
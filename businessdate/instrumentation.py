@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+# businessdate
+# ------------
+# Python library for generating business dates for fast date operations
+# and rich functionality.
+#
+# Author:   sonntagsgesicht, based on a fork of Deutsche Postbank [pbrisk]
+# Version:  0.5, copyright Wednesday, 18 September 2019
+# Website:  https://github.com/sonntagsgesicht/businessdate
+# License:  Apache License 2.0 (see LICENSE file)
+
+
+""" opt-in runtime instrumentation of :mod:`businessdate`
+
+Instrumentation is disabled by default and costs nothing but a flag check
+at the end of day stepping loops.
+Once enabled by :func:`enable`
+
+    * public entry points like :meth:`BusinessDate.adjust` count calls
+      and cumulated (inclusive) time,
+    * holiday membership checks of :class:`BusinessHolidays` are counted,
+    * parses of period strings and of complex date strings (not taken from cache) are counted,
+    * day steps of :meth:`BusinessDate.add_period` and of business day adjustments are counted
+      (i.e. days walked if no :class:`BusinessDayIndex` covers the dates).
+
+:func:`disable` removes the instrumentation again
+and :func:`stats` (also given as :code:`businessdate.stats()`) returns all figures
+incl. statistics of the caches.
+Counters are not guarded by a lock, so figures of concurrent threads are approximate.
+"""
+
+from functools import wraps
+from timeit import default_timer
+
+ENABLED = False
+
+_counters = dict()
+_calls = dict()
+_seconds = dict()
+_originals = list()
+
+# public entry points timed by (module, class, attribute)
+ENTRY_POINTS = (
+    ('businessdate', '_BusinessDate', '__new__'),
+    ('businessdate', '_BusinessDate', 'add_period'),
+    ('businessdate', '_BusinessDate', 'adjust'),
+    ('businessdate', '_BusinessDate', 'get_day_count'),
+    ('businessdate', '_BusinessDate', 'diff_in_days'),
+    ('businessdate', '_BusinessDate', 'diff_in_business_days'),
+    ('businessdate', '_BusinessDate', 'diff_in_ymd'),
+    ('businessdate', '_BusinessDate', 'is_business_day'),
+    ('businessperiod', 'BusinessPeriod', '__new__'),
+    ('businessrange', 'BusinessRange', '__init__'),
+    ('businessrange', 'LazyBusinessRange', '__init__'),
+    ('businessschedule', 'BusinessSchedule', '__init__'),
+    ('businessschedule', 'CashFlowSchedule', '__init__'),
+    ('dateexpression', 'DateExpression', 'evaluate'),
+)
+
+
+def count(name, n=1):
+    """ adds `n` to counter `name` """
+    _counters[name] = _counters.get(name, 0) + n
+
+
+def _counted(name, func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        _counters[name] = _counters.get(name, 0) + 1
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def _timed(name, func):
+    timer = default_timer
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        _calls[name] = _calls.get(name, 0) + 1
+        start = timer()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _seconds[name] = _seconds.get(name, 0.) + timer() - start
+    return wrapper
+
+
+def _install(cls, attr, wrap):
+    # replaces cls.attr by wrapped function keeping the kind of method
+    original = cls.__dict__[attr]
+    if isinstance(original, staticmethod):
+        new = staticmethod(wrap(original.__func__))
+    elif isinstance(original, classmethod):
+        new = classmethod(wrap(original.__func__))
+    else:
+        new = wrap(original)
+    _originals.append((cls, attr, original))
+    setattr(cls, attr, new)
+
+
+def _subclasses(cls):
+    yield cls
+    for sub in cls.__subclasses__():
+        for c in _subclasses(sub):
+            yield c
+
+
+def enable():
+    """ enables instrumentation """
+    global ENABLED
+    if ENABLED:
+        return
+    from importlib import import_module
+    from .businessholidays import BusinessHolidays
+    from .businessperiod import BusinessPeriod
+    from .dateexpression import DateExpression
+
+    for module, cls, attr in ENTRY_POINTS:
+        cls = getattr(import_module('.' + module, __package__), cls)
+        name = '%s.%s' % (cls.__name__.lstrip('_'), attr)
+        _install(cls, attr, lambda func, name=name: _timed(name, func))
+    for cls in set(_subclasses(BusinessHolidays)):
+        if '__contains__' in cls.__dict__:
+            _install(cls, '__contains__', lambda func: _counted('holiday checks', func))
+    _install(BusinessPeriod, '_parse_period_str_uncached', lambda func: _counted('period parses', func))
+    _install(DateExpression, '_parse', lambda func: _counted('expression parses', func))
+    ENABLED = True
+
+
+def disable():
+    """ disables instrumentation (but keeps figures) """
+    global ENABLED
+    while _originals:
+        cls, attr, original = _originals.pop()
+        setattr(cls, attr, original)
+    ENABLED = False
+
+
+def reset():
+    """ resets all figures (but not the statistics of the caches) """
+    _counters.clear()
+    _calls.clear()
+    _seconds.clear()
+
+
+def stats():
+    """ returns :class:`dict` of instrumentation figures
+
+    with items
+
+        * **enabled** whether instrumentation is enabled,
+        * **counters** :class:`dict` of counters,
+          i.e. **holiday checks**, **business day steps**, **adjust day steps**,
+          **period parses** and **expression parses**,
+        * **timers** :class:`dict` of entry points with :class:`dict` of **calls** and **seconds**,
+        * **caches** :class:`dict` of caches with their statistics (see :meth:`LRUCache.info`).
+    """
+    from .businessdate import BusinessDate
+    from .businessperiod import BusinessPeriod
+    from .dateexpression import DateExpression
+
+    counters = dict.fromkeys(('holiday checks', 'business day steps', 'adjust day steps',
+                              'period parses', 'expression parses'), 0)
+    counters.update(_counters)
+    timers = dict((name, dict(calls=calls, seconds=_seconds.get(name, 0.))) for name, calls in _calls.items())
+    caches = {
+        'BusinessPeriod.PARSE_CACHE': BusinessPeriod.PARSE_CACHE.info(),
+        'DateExpression.PARSE_CACHE': DateExpression.PARSE_CACHE.info(),
+        'BusinessDate.RESULT_CACHE': BusinessDate.RESULT_CACHE.info(),
+    }
+    return dict(enabled=ENABLED, counters=counters, timers=timers, caches=caches)
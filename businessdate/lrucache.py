@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# businessdate
+# ------------
+# Python library for generating business dates for fast date operations
+# and rich functionality.
+#
+# Author:   sonntagsgesicht, based on a fork of Deutsche Postbank [pbrisk]
+# Version:  0.5, copyright Wednesday, 18 September 2019
+# Website:  https://github.com/sonntagsgesicht/businessdate
+# License:  Apache License 2.0 (see LICENSE file)
+
+
+from collections import OrderedDict
+from threading import Lock
+
+
+class LRUCache(object):
+    """ bounded and thread safe cache dropping the least recently used items first
+
+    :param int maxsize: maximal number of items stored
+     (default: 128, `None` for no bound and `0` to disable caching)
+
+    Keeps statistics of cache hits and misses (see :meth:`LRUCache.info`).
+    """
+
+    def __init__(self, maxsize=128):
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """ returns cached value of `key` and `default` if not found """
+        with self._lock:
+            try:
+                # pop and insert again marks key as most recently used (works on Python 2.7, too)
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """ stores `value` for `key` and drops least recently used items beyond `maxsize` """
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            self._trim()
+
+    def _trim(self):
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """ drops all items and resets statistics """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def resize(self, maxsize):
+        """ sets new `maxsize` and drops least recently used items beyond """
+        with self._lock:
+            self.maxsize = maxsize
+            self._trim()
+
+    def info(self):
+        """ returns :class:`dict` with `hits`, `misses`, `maxsize` and `currsize` """
+        return dict(hits=self.hits, misses=self.misses, maxsize=self.maxsize, currsize=len(self._data))
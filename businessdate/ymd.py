@@ -13,6 +13,11 @@
 
 from math import floor
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 #: list(int): non-leap year number of days per month
 _days_per_month = \
     [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
@@ -161,6 +166,45 @@ def is_valid_ymd(year, month, day):
     return 1 <= month <= 12 and 1 <= day <= days_in_month(year, month) and year >= 1899
 
 
+# Dates are converted by closed form day number algorithms
+# (see H. Hinnant, chrono-Compatible Low-Level Date Algorithms)
+# counting days since 1970-01-01 in the proleptic Gregorian calendar
+# with years shifted to start on March, 1st so that leap days fall at the end of a year.
+
+#: int: days from 0000-03-01 to 1970-01-01
+_epoch_shift = 719468
+
+#: int: days from 1970-01-01 to 1900-03-01, i.e. the first date not hit by the excel leap year bug
+_excel_bug_days = -25508
+
+#: int: excel representation of 1970-01-01
+_excel_epoch = 25569
+
+
+def _days_from_civil(year, month, day):
+    # works for int as well as numpy arrays
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + 12 * (month <= 2) - 3) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - _epoch_shift
+
+
+def _civil_from_days(days):
+    # works for int as well as numpy arrays
+    days = days + _epoch_shift
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = shifted_month + 3 - 12 * (shifted_month >= 10)
+    year = year_of_era + era * 400 + (month <= 2)
+    return year, month, day
+
+
 def from_excel_to_ymd(excel_int):
     """
     converts date in Microsoft Excel representation style and returns `(year, month, day)` tuple
@@ -169,33 +213,22 @@ def from_excel_to_ymd(excel_int):
     :return tuple(int, int, int):
     """
 
-    int_date = int(floor(excel_int))
-    int_date -= 1 if excel_int > 60 else 0
     # jd: There are two errors in excels own date <> int conversion.
     # The first is that there exists the 00.01.1900 and the second that there never happened to be a 29.2.1900 since it
     # was no leap year. So there is the int 60 <> 29.2.1900 which has to be jumped over.
+    days = excel_int if type(excel_int) is int else int(floor(excel_int))
+    days += _epoch_shift - _excel_epoch if excel_int > 60 else _epoch_shift - _excel_epoch + 1
 
-    year = (int_date - 1) // 365
-    rest_days = int_date - 365 * year - (year + 3) // 4 + (year + 99) // 100 - (year + 299) // 400
-    year += 1900
-
-    while rest_days <= 0:
-        year -= 1
-        rest_days += days_in_year(year)
-
-    month = 1
-    if is_leap_year(year) and rest_days == 60:
-        month = 2
-        day = 29
-    else:
-        if is_leap_year(year) and rest_days > 60:
-            rest_days -= 1
-
-        while rest_days > _cum_month_days[month]:
-            month += 1
-
-        day = rest_days - _cum_month_days[month - 1]
-    return year, month, day
+    # scalar version of _civil_from_days
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    if shifted_month < 10:
+        return year_of_era + era * 400, shifted_month + 3, day
+    return year_of_era + era * 400 + 1, shifted_month - 9, day
 
 
 def from_ymd_to_excel(year, month, day):
@@ -207,16 +240,44 @@ def from_ymd_to_excel(year, month, day):
     :param int day:
     :return int:
     """
-    if not is_valid_ymd(year, month, day):
+    if not (1 <= month <= 12 and 1 <= day <= 28 and year >= 1899) and not is_valid_ymd(year, month, day):
         raise ValueError("Invalid date {0}.{1}.{2}".format(year, month, day))
 
-    days = _cum_month_days[month - 1] + day
-    days += 1 if (is_leap_year(year) and month > 2) else 0
+    # scalar version of _days_from_civil
+    if month <= 2:
+        year -= 1
+        month += 12
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + (153 * month - 457) // 5 + day - 1
+    days = era * 146097 + day_of_era - _epoch_shift
+
+    # count days since 30.12.1899 (excluding 30.12.1899) (workaround for excel bug)
+    return days + _excel_epoch if days >= _excel_bug_days else days + _excel_epoch - 1
+
+
+def from_excel_to_ymd_array(excel_array):
+    """
+    converts array of dates in Microsoft Excel representation style into arrays `year, month, day`
+
+    :param excel_array: array of int (days since 1899-12-31)
+    :return tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray):
+    """
+    excel_array = np.asarray(excel_array)
+    days = np.floor(excel_array).astype(np.int64) - _excel_epoch + (excel_array <= 60)
+    return _civil_from_days(days)
 
-    years_distance = year - 1900
-    days += \
-        years_distance * 365 + (years_distance + 3) // 4 - (years_distance + 99) // 100 + (years_distance + 299) // 400
 
+def from_ymd_to_excel_array(year, month, day):
+    """
+    converts arrays of `year, month, day` into Microsoft Excel representation style
+
+    :param year: array of int
+    :param month: array of int
+    :param day: array of int
+    :return numpy.ndarray:
+    """
+    year, month, day = (np.asarray(x, dtype=np.int64) for x in (year, month, day))
+    days = _days_from_civil(year, month, day)
     # count days since 30.12.1899 (excluding 30.12.1899) (workaround for excel bug)
-    days += 1 if (year, month, day) > (1900, 2, 28) else 0
-    return days
+    return days + _excel_epoch - (days < _excel_bug_days)
@@ -12,21 +12,39 @@
 
 
 import os
+import pickle
+import shutil
 import sys
+import tempfile
 import unittest
 
+from calendar import MONDAY, THURSDAY
+from copy import copy, deepcopy
 from datetime import datetime, date, timedelta
+from threading import Thread
 
 sys.path.append('.')
 sys.path.append('..')
 
-from businessdate import BusinessDate, BusinessPeriod, BusinessRange, BusinessSchedule, BusinessHolidays
-from businessdate.businessholidays import TargetHolidays
-
-from businessdate.basedate import BaseDateFloat, BaseDateDatetimeDate
+from businessdate import BusinessDate, BusinessPeriod, BusinessRange, LazyBusinessRange, BusinessSchedule, BusinessHolidays, \
+    BusinessDateArray, DateExpression, CashFlowSchedule, OrdinalBusinessDate
+from businessdate.businessdate import _BusinessDate
+from businessdate.businessholidays import TargetHolidays, RuleBasedHolidays, JointCalendar
+from businessdate.holidayrules import FixedHoliday, EasterHoliday, WeekdayHoliday, \
+    sunday_to_monday, weekend_to_monday, nearest_weekday
+from businessdate.conventions import is_business_day, adjust_follow, adjust_mod_follow
+from businessdate.daycount import get_act_360
+
+from businessdate import instrumentation, stats
+from businessdate.basedate import BaseDateFloat, BaseDateDatetimeDate, BaseDateOrdinal
 from businessdate.ymd import from_ymd_to_excel, from_excel_to_ymd, \
     is_valid_ymd, end_of_quarter_month, days_in_month, \
-    days_in_year, is_leap_year, easter
+    days_in_year, is_leap_year, easter, from_excel_to_ymd_array, from_ymd_to_excel_array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 TEST_DATA = "test/test_data/" if os.path.exists('test/test_data/') else "test_data/"
 
@@ -39,6 +57,21 @@ def _silent(func, *args):
     return _res
 
 
+def _grid(start, end, step, roll):
+    # reference grid of roll + step * i in [start, end) by stepping one grid point after the other
+    p = BusinessPeriod(step)
+    p = p if roll <= roll + p else -1 * p
+    i = 0
+    while start <= roll + p * i:
+        i -= 1
+    grid = list()
+    while roll + p * i < end:
+        if start <= roll + p * i:
+            grid.append(roll + p * i)
+        i += 1
+    return grid
+
+
 class BaseDateUnitTest(unittest.TestCase):
     def setUp(self):
         self.pairs = list()  # to store date(as string), exceldate[int](as string)
@@ -74,6 +107,22 @@ class BaseDateUnitTest(unittest.TestCase):
             days = 30 if m in (4, 6, 9, 11) else 31 if m is not 2 else 29 if leap else 28
             self.assertEqual(days, days_in_month(y, m))
 
+    def test_ymd_closed_form(self):
+        d = date(1899, 12, 31)
+        for excel in range(0, 80000):
+            d -= timedelta(1 if excel == 61 else 0)
+            self.assertEqual((d.year, d.month, d.day), from_excel_to_ymd(excel))
+            self.assertEqual(excel + (excel == 60), from_ymd_to_excel(d.year, d.month, d.day))
+            d += timedelta(1)
+
+    @unittest.skipIf(np is None, 'requires numpy')
+    def test_ymd_array(self):
+        excel = np.arange(-400, 80000)
+        year, month, day = from_excel_to_ymd_array(excel)
+        self.assertEqual(list(zip(year, month, day)), [from_excel_to_ymd(e) for e in excel])
+        self.assertEqual(list(from_ymd_to_excel_array(year, month, day)[401:]),
+                         [from_ymd_to_excel(*ymd) for ymd in zip(year[401:], month[401:], day[401:])])
+
     def test_base_date_float(self):
         for ymd, f in self.pairs:
             bd = BaseDateFloat(f)
@@ -132,6 +181,34 @@ class BaseDateUnitTest(unittest.TestCase):
 
             self.assertEqual(5, BaseDateFloat.from_ymd(2016, 12, 31).weekday())
 
+    def test_base_date_ordinal(self):
+        for ymd, f in self.pairs:
+            bd = BaseDateOrdinal(date(*ymd).toordinal())
+
+            self.assertEqual(date(*ymd).toordinal(), bd)
+            self.assertEqual(ymd, (bd.year, bd.month, bd.day))
+            self.assertEqual(date(*ymd).weekday(), bd.weekday())
+
+            self.assertEqual(bd, BaseDateOrdinal.from_float(f))
+            self.assertEqual(f, bd.to_float())
+
+            self.assertEqual(bd, BaseDateOrdinal.from_ymd(*ymd))
+            self.assertEqual(ymd, bd.to_ymd())
+
+            self.assertEqual(bd, BaseDateOrdinal.from_date(date(*ymd)))
+            self.assertEqual(date(*ymd), bd.to_date())
+
+            a, b = bd, BaseDateOrdinal.from_date(date(*ymd) + timedelta(1))
+            self.assertEqual(b, a._add_days(1))
+            self.assertEqual(a, b._add_days(-1))
+            self.assertEqual(1, a._diff_in_days(b))
+            self.assertEqual(-1, b._diff_in_days(a))
+
+        bd = BaseDateOrdinal.from_ymd(2016, 12, 31)
+        self.assertFalse(hasattr(bd, '__dict__'))
+        self.assertRaises(AttributeError, setattr, bd, '_ymd', (2016, 12, 31))
+        self.assertEqual(bd, pickle.loads(pickle.dumps(bd)))
+
 
 class DayCountUnitTests(unittest.TestCase):
     # n(ame) cor(respondence)
@@ -171,6 +248,22 @@ class DayCountUnitTests(unittest.TestCase):
             for k, v in daycount.items():
                 self.assertAlmostEqual(float(v), start.get_day_count(end, DayCountUnitTests.ncor[k].lstrip('get_')))
 
+    @unittest.skipIf(np is None, 'requires numpy')
+    def test_day_count_array(self):
+        from businessdate import daycount
+        start = [s for s, e, _ in self.test_data]
+        end = [e for s, e, _ in self.test_data]
+        grid = list(BusinessRange(BusinessDate(18991231), BusinessDate(19000310), '1d'))
+        grid += list(BusinessRange(BusinessDate(19951225), BusinessDate(20050310), '13d'))
+        start += [s for s in grid for _ in grid[::17]]
+        end += [e for _ in grid for e in grid[::17]]
+        excel = [int(s.to_float()) for s in start], [int(e.to_float()) for e in end]
+        ymd = tuple(zip(*[s.to_ymd() for s in start])), tuple(zip(*[e.to_ymd() for e in end]))
+        for func, array_func in daycount._array_func.items():
+            expected = [func(s.to_date(), e.to_date()) for s, e in zip(start, end)]
+            self.assertEqual(list(array_func(*excel)), expected, func.__name__)
+            self.assertEqual(list(array_func(*ymd)), expected, func.__name__)
+
 
 class BusinessHolidaysUnitTests(unittest.TestCase):
     def setUp(self):
@@ -213,6 +306,158 @@ class BusinessHolidaysUnitTests(unittest.TestCase):
         self.assertTrue(BusinessDate(20160328).to_date() in self.holidays)
         self.assertTrue(BusinessDate(20160501).to_date() in self.holidays)
 
+    def test_target_days_generation(self):
+        t = TargetHolidays()
+        self.assertTrue(date(2016, 1, 1) in t)
+        self.assertEqual(0, t._version)
+        self.assertEqual(sorted(self.target[2016]), sorted(t))
+
+        t.warm(2015, 2020)
+        self.assertEqual(0, t._version)
+        self.assertEqual(sorted(sum(self.target.values(), [])), sorted(t))
+
+        t = TargetHolidays()
+        threads = [Thread(target=lambda: [date(y, 5, 1) in t for y in range(2000, 2100)]) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(600, len(t))
+        self.assertEqual(600, len(set(t)))
+
+        t = TargetHolidays()
+        t.warm(2016, 2016).remove(date(2016, 3, 25))
+        self.assertFalse(date(2016, 3, 25) in t)
+        self.assertEqual(5, len(t))
+        t.remove(date(2016, 1, 1))
+        self.assertFalse(date(2016, 1, 1) in t)
+        self.assertEqual(4, len(t))
+        t.clear()
+        self.assertTrue(date(2016, 1, 1) in t)
+        self.assertEqual(6, len(t))
+
+    def test_rule_based_holidays(self):
+        rules = (FixedHoliday(1, 1, "New Year's Day", nearest_weekday),
+                 FixedHoliday(7, 4, 'Independence Day', nearest_weekday),
+                 FixedHoliday(12, 25, 'Christmas Day', sunday_to_monday),
+                 FixedHoliday(12, 26, 'Boxing Day', weekend_to_monday),
+                 WeekdayHoliday(1, MONDAY, 3, 'Martin Luther King Jr. Day', start_year=1998),
+                 WeekdayHoliday(5, MONDAY, -1, 'Memorial Day'),
+                 WeekdayHoliday(11, THURSDAY, 4, 'Thanksgiving Day'),
+                 EasterHoliday(-2, 'Good Friday'))
+        h = RuleBasedHolidays(rules=rules)
+        self.assertTrue(date(2021, 12, 31) in h)  # Saturday New Year's Day 2022
+        self.assertTrue(date(2021, 7, 5) in h)  # Sunday
+        self.assertTrue(date(2020, 7, 3) in h)  # Saturday
+        self.assertTrue(date(2022, 12, 26) in h)
+        self.assertTrue(date(2021, 12, 27) in h)
+        self.assertTrue(date(2021, 12, 28) not in h)
+        self.assertTrue(date(2020, 1, 20) in h)
+        self.assertTrue(date(1997, 1, 20) not in h)
+        self.assertTrue(date(2020, 5, 25) in h)
+        self.assertTrue(date(2021, 5, 31) in h)
+        self.assertTrue(date(2020, 11, 26) in h)
+        self.assertTrue(date(2020, 4, 10) in h)
+        self.assertEqual(0, h._version)
+
+        h.append(date(2020, 6, 19))
+        self.assertTrue(date(2020, 6, 19) in h)
+        h.remove(date(2020, 6, 19))
+        self.assertTrue(date(2020, 6, 19) not in h)
+
+        # weekmask
+        h = RuleBasedHolidays([date(2020, 1, 2)], rules=(FixedHoliday(1, 1),), weekmask='0111110')
+        self.assertFalse(is_business_day(date(2020, 1, 1), h))
+        self.assertFalse(is_business_day(date(2020, 1, 2), h))
+        self.assertTrue(is_business_day(date(2020, 1, 4), h))
+        self.assertFalse(is_business_day(date(2020, 1, 5), h))
+        self.assertFalse(is_business_day(date(2020, 1, 6), h))
+        self.assertEqual(BusinessDate(20200107), BusinessDate(20200103).add_period('2B', h))
+        self.assertEqual(2, BusinessDate(20200103).diff_in_business_days(20200107, h))
+        self.assertEqual(h, pickle.loads(pickle.dumps(h)))
+        self.assertEqual(h.weekmask, pickle.loads(pickle.dumps(h)).weekmask)
+
+        t = TargetHolidays()
+        self.assertEqual(t.rules, TargetHolidays.RULES)
+        self.assertEqual(t.warm(2015, 2020), TargetHolidays(sorted(sum(self.target.values(), []))))
+
+    def test_joint_calendar(self):
+        target = TargetHolidays()
+        other = RuleBasedHolidays([date(2016, 1, 4)], rules=(FixedHoliday(5, 5), EasterHoliday(0)), weekmask='1111110')
+        h = JointCalendar((target, other))
+        b = JointCalendar((target, other), 'businessdays')
+        self.assertRaises(ValueError, JointCalendar, (target, other), 'something')
+
+        d = date(2015, 12, 1)
+        while d < date(2017, 2, 1):
+            t, o = is_business_day(d, target), is_business_day(d, other)
+            self.assertEqual(t and o, is_business_day(d, h))
+            self.assertEqual(t or o, is_business_day(d, b))
+            self.assertEqual(t and o, BusinessDate(d).is_business_day(h))
+            d += timedelta(1)
+        self.assertTrue(date(2016, 5, 1) in h)
+        self.assertTrue(date(2016, 5, 5) in h)
+        self.assertTrue(date(2016, 3, 27) in h)
+        self.assertFalse(date(2016, 5, 5) in b)
+        self.assertTrue(date(2016, 3, 27) in b)  # sunday in both calendars
+
+        self.assertEqual(BusinessDate(20160105), BusinessDate(20151231).add_period('1B', h))
+        self.assertEqual(BusinessDate(20160101), BusinessDate(20151231).add_period('1B', b))
+        self.assertEqual(BusinessDate(20160105), BusinessDate(20160101).adjust('follow', h))
+        self.assertEqual([BusinessDate(20160105), BusinessDate(20160105), BusinessDate(20160105)],
+                         BusinessRange(20160101, 20160106).adjust('follow', h)[2:])
+
+        # modification of calendars
+        self.assertTrue(date(2016, 1, 6) not in h)
+        other.append(date(2016, 1, 6))
+        self.assertTrue(date(2016, 1, 6) in h)
+        self.assertEqual(BusinessDate(20160107), BusinessDate(20151231).add_period('2B', h))
+        h.append(date(2016, 1, 7))
+        self.assertTrue(date(2016, 1, 7) in h)
+        self.assertEqual(BusinessDate(20160108), BusinessDate(20151231).add_period('2B', h))
+        other.remove(date(2016, 1, 6))
+        self.assertEqual(BusinessDate(20160106), BusinessDate(20151231).add_period('2B', h))
+
+        p = pickle.loads(pickle.dumps(h))
+        self.assertEqual((h.join, list(h), len(h.calendars)), (p.join, list(p), len(p.calendars)))
+
+    def test_binary_calendar(self):
+        target = TargetHolidays()
+        other = RuleBasedHolidays([date(2016, 1, 4)], rules=(FixedHoliday(5, 5),), weekmask='1111110')
+        path = tempfile.mkdtemp()
+        joint = JointCalendar((target, other))
+        for calendar, weekmask in ((target, target.weekmask), (other, other.weekmask), (joint, target.weekmask)):
+            file_name = os.path.join(path, 'calendar.bin')
+            calendar.save(file_name, 2000, 2030)
+            for mmap in (True, False):
+                loaded = BusinessHolidays.load(file_name, mmap)
+                self.assertEqual(date(2000, 1, 1).toordinal(), loaded.business_day_index().first)
+                self.assertEqual(date(2031, 1, 1).toordinal(), loaded.business_day_index().last)
+                d = date(1999, 12, 1)
+                while d < date(2031, 2, 1):
+                    b = is_business_day(d, calendar) if 2000 <= d.year <= 2030 else weekmask[d.weekday()]
+                    self.assertEqual(b, is_business_day(d, loaded))
+                    d += timedelta(1)
+                start = BusinessDate(20151228)
+                for n in (1, 5, 17, 250, -3, -300):
+                    self.assertEqual(start.add_period('%dB' % n, calendar), start.add_period('%dB' % n, loaded))
+                    end = start.add_period('%dB' % n, calendar)
+                    self.assertEqual(start.diff_in_business_days(end, calendar),
+                                     start.diff_in_business_days(end, loaded))
+                loaded.append(date(2016, 1, 5))
+                self.assertEqual(BusinessDate(20160106), BusinessDate(20160105).adjust('follow', loaded))
+                # saving a loaded calendar keeps its weekend
+                copy_name = os.path.join(path, 'copy.bin')
+                loaded.save(copy_name, 2020, 2021)
+                copy = BusinessHolidays.load(copy_name, False)
+                self.assertEqual(weekmask[5], is_business_day(date(2022, 1, 1), copy))
+                del loaded, copy
+        joint = JointCalendar((target, other), join='businessdays')
+        joint.save(file_name, 2020, 2021)
+        self.assertTrue(is_business_day(date(2022, 1, 1), BusinessHolidays.load(file_name, False)))
+        self.assertRaises(ValueError, BusinessHolidays.load, TEST_DATA + os.listdir(TEST_DATA)[0], False)
+        shutil.rmtree(path)
+
 
 class BusinessDateUnitTests(unittest.TestCase):
     def setUp(self):
@@ -256,6 +501,54 @@ class BusinessDateUnitTests(unittest.TestCase):
         self.assertEqual(self.jan02, BusinessDate(42371.0))
         self.assertEqual([self.jan01, self.jan02], BusinessDate([20160101, 42371]))
 
+    def test_bulk_constructors(self):
+        ordinals = list(range(date(2015, 12, 1).toordinal(), date(2016, 3, 31).toordinal()))
+        dates = [BusinessDate(date.fromordinal(o)) for o in ordinals]
+        self.assertEqual(dates, BusinessDate.from_ordinals(ordinals))
+        self.assertEqual(dates, [BusinessDate(int(d.strftime('%Y%m%d'))) for d in dates])
+        self.assertEqual(dates, [BusinessDate(BusinessDate(d)) for d in dates])
+        iso_strs = [d.isoformat() for d in dates]
+        self.assertEqual(dates, BusinessDate.from_iso_strings(iso_strs))
+        self.assertEqual(dates, [BusinessDate(s) for s in iso_strs])
+        self.assertEqual([self.jan01, self.jan02], BusinessDate.from_iso_strings(['2016-01-01', '02.01.2016']))
+        self.assertTrue(all(type(d) is BusinessDate for d in BusinessDate.from_ordinals(ordinals)))
+        self.assertRaises(ValueError, BusinessDate, '2016-02-30')
+        self.assertRaises(ValueError, BusinessDate, 20160230)
+        self.assertEqual(BusinessDate(20160101), BusinessDate(20151301))
+
+    def test_ordinal_backend(self):
+        for inp in (20160102, '2016-01-02', '02.01.2016', 42371, date(2016, 1, 2), self.jan02):
+            self.assertEqual(self.jan02.to_ymd(), OrdinalBusinessDate(inp).to_ymd())
+            self.assertEqual(OrdinalBusinessDate, type(OrdinalBusinessDate(inp)))
+        self.assertEqual(self.jan02, BusinessDate(OrdinalBusinessDate(self.jan02)))
+        self.assertEqual(OrdinalBusinessDate(date.today() + timedelta(2)), OrdinalBusinessDate(timedelta(2)))
+        self.assertEqual(repr(OrdinalBusinessDate(20160102)), 'OrdinalBusinessDate(20160102)')
+
+        o = OrdinalBusinessDate(20160102)
+        self.assertFalse(hasattr(o, '__dict__'))
+        self.assertRaises(AttributeError, setattr, o, 'year', 2017)
+        self.assertEqual(o, pickle.loads(pickle.dumps(o)))
+        self.assertEqual(OrdinalBusinessDate, type(pickle.loads(pickle.dumps(o))))
+        self.assertEqual(o, deepcopy(o))
+
+        for d in self.dates:
+            o = OrdinalBusinessDate(d)
+            for p in ('1D', '1M', '3M', '1Y2M3D', '-1Y', '2B', '-3B', '0B1D2BMODFOLLOW'):
+                res = o + p if p[-1] in 'DMYB' else OrdinalBusinessDate(p + str(d))
+                exp = d + p if p[-1] in 'DMYB' else BusinessDate(p + str(d))
+                self.assertEqual(OrdinalBusinessDate, type(res))
+                self.assertEqual(exp.to_ymd(), res.to_ymd())
+            for c in ('mod_follow', 'previous', 'eom', 'imm'):
+                self.assertEqual(d.adjust(c).to_ymd(), o.adjust(c).to_ymd())
+            for e in self.dates:
+                self.assertEqual(d - e, o - OrdinalBusinessDate(e))
+                self.assertEqual(d.diff_in_days(e), o.diff_in_days(OrdinalBusinessDate(e)))
+                self.assertEqual(d.diff_in_business_days(e), o.diff_in_business_days(OrdinalBusinessDate(e)))
+                self.assertEqual(d.get_day_count(e, 'act_act'), o.get_day_count(OrdinalBusinessDate(e), 'act_act'))
+                self.assertEqual(d < e, o < OrdinalBusinessDate(e))
+            self.assertEqual(d.end_of_quarter().to_ymd(), o.end_of_quarter().to_ymd())
+            self.assertEqual(d.is_business_day(), o.is_business_day())
+
     def test_to_string(self):
         self.assertEqual(self.jan02, BusinessDate(str(self.jan02)))
         self.assertEqual(str(self.jan02), '20160102')
@@ -503,6 +796,94 @@ class BusinessDateUnitTests(unittest.TestCase):
         self.assertTrue(BusinessDate.is_businessdate('20160229'))
         self.assertFalse(BusinessDate.is_businessdate('20150229'))
 
+    def test_convention_registry(self):
+        # conventions given as functions
+        self.assertEqual(self.jan01.adjust('follow'), self.jan01.adjust(adjust_follow))
+        self.assertEqual(self.jan31.adjust('MOD_FOLLOW'), self.jan31.adjust(adjust_mod_follow))
+        self.assertEqual(self.jan01.get_day_count(self.mar31, 'act_360'), self.jan01.get_day_count(self.mar31, get_act_360))
+        self.assertEqual(BusinessRange(self.jan01, self.mar31, '1M').adjust('follow'),
+                         BusinessRange(self.jan01, self.mar31, '1M').adjust(adjust_follow))
+        self.assertEqual(CashFlowSchedule(self.jan01, self.sep30, '3M', convention='follow', day_count='act_360').year_fractions,
+                         CashFlowSchedule(self.jan01, self.sep30, '3M', convention=adjust_follow, day_count=get_act_360).year_fractions)
+
+        # shortcuts are methods
+        self.assertTrue(callable(BusinessDate.__mro__[1].__dict__['adjust_mod_follow']))
+        self.assertEqual(self.jan01.adjust('follow'), self.jan01.adjust_flw())
+        self.assertEqual(self.jan01.get_day_count(self.mar31, 'act_36525'), getattr(self.jan01, 'get_act_365.25')(self.mar31))
+        self.assertRaises(AttributeError, getattr, self.jan01, 'adjust_unknown')
+        self.assertRaises(KeyError, self.jan01.adjust, 'unknown')
+
+        # custom conventions
+        def adjust_to_monday(business_date, holidays=()):
+            return business_date + timedelta((7 - business_date.weekday()) % 7)
+
+        def get_days(start, end):
+            return float((end - start).days)
+
+        BusinessDate.register_adjust_convention(adjust_to_monday, 'to_monday', 'MON')
+        BusinessDate.register_day_count(get_days, 'days')
+        try:
+            self.assertEqual(self.jan04, self.jan01.adjust('to_monday'))
+            self.assertEqual(self.jan04, self.jan02.adjust_mon())
+            self.assertEqual(self.jan04, OrdinalBusinessDate(self.jan01).adjust_to_monday().to_date())
+            self.assertEqual(self.jan04, BusinessDate('0BTO_MONDAY20160101'))
+            self.assertEqual(self.jan04 + '1D', BusinessDate('0B1DMON20160101'))
+            self.assertEqual(90., self.jan01.get_days(self.mar31))
+            self.assertEqual(90., self.jan01.get_day_count(self.mar31, 'DAYS'))
+            self.assertEqual([self.jan04, BusinessDate(20160201), BusinessDate(20160307)],
+                             list(BusinessRange(self.jan01, self.mar31, '1M').adjust('mon')))
+            self.assertRaises(ValueError, BusinessDate.register_day_count, get_days, 'day_count')
+        finally:
+            for name in ('to_monday', 'mon'):
+                del BusinessDate._adj_func[name]
+                delattr(BusinessDate.__mro__[1], 'adjust_' + name)
+                BusinessDate._shortcuts.remove('adjust_' + name)
+            del BusinessDate._dc_func['days']
+            delattr(BusinessDate.__mro__[1], 'get_days')
+            BusinessDate._shortcuts.remove('get_days')
+            DateExpression.set_conventions(BusinessDate._adj_func.keys())
+
+    def test_result_cache(self):
+        cache = BusinessDate.RESULT_CACHE
+        self.assertEqual(0, cache.maxsize)
+        holidays = BusinessHolidays([self.jan04])
+        expected = [(d.adjust('mod_follow', holidays), d.add_period('2B', holidays), d + '1M') for d in self.dates]
+        self.assertEqual(0, len(cache))
+
+        cache.resize(1000)
+        for _ in range(2):
+            res = [(d.adjust('mod_follow', holidays), d.add_period('2B', holidays), d + '1M') for d in self.dates]
+            self.assertEqual(expected, res)
+        info = cache.info()
+        self.assertEqual(3 * len(self.dates), info['hits'])
+        self.assertEqual(3 * len(self.dates), info['misses'])
+        self.assertTrue(self.jan02.adjust('follow', holidays) is self.jan02.adjust('follow', holidays))
+        self.assertEqual(self.jan02.adjust('follow', holidays), self.jan02.adjust('FOLLOW', holidays))
+
+        # modifying the calendar invalidates cached results
+        version = holidays.version
+        holidays.remove(self.jan04)
+        self.assertEqual(version + 1, holidays.version)
+        self.assertEqual(self.jan04, self.jan02.adjust('follow', holidays))
+        self.assertEqual(BusinessDate(20160105), self.jan01.add_period('2B', holidays))
+        holidays.append(self.jan04)
+        self.assertEqual(BusinessDate(20160105), self.jan02.adjust('follow', holidays))
+
+        # calendars without version are not cached
+        cache.clear()
+        self.assertEqual(self.jan04, self.jan02.adjust('follow', [self.jan01]))
+        self.assertEqual(0, len(cache))
+
+        # joint calendars follow modifications of their calendars
+        joint = JointCalendar([holidays])
+        self.assertEqual(BusinessDate(20160105), self.jan02.adjust('follow', joint))
+        holidays.remove(self.jan04)
+        self.assertEqual(self.jan04, self.jan02.adjust('follow', joint))
+
+        cache.resize(0)
+        cache.clear()
+        self.assertEqual(0, len(cache))
+
     def test_is_business_date(self):
         d = self.dec31_15
         holi = BusinessHolidays()
@@ -519,6 +900,40 @@ class BusinessDateUnitTests(unittest.TestCase):
         b = d._add_business_days(2)  # default holidays contains the target days, i.e. the 1.1.2016
         self.assertEqual(target_b, b)
 
+    def test_diff_in_ymd(self):
+        def loop_diff_in_ymd(start, end_date):
+            # former implementation
+            if end_date < start:
+                y, m, d = 0, 0, 0
+                while end_date < start._add_ymd(y, 0, 0):
+                    y -= 1
+                while end_date < start._add_ymd(y + 1, m, 0):
+                    m -= 1
+                while end_date < start._add_ymd(y + 1, m + 1, d):
+                    d -= 1
+                return y + 1, m + 1, d
+            y = end_date.year - start.year
+            m = end_date.month - start.month
+            d = end_date.day - start.day
+            while m < 0:
+                y -= 1
+                m += 12
+            while d < 0:
+                m -= 1
+                if m < 0:
+                    y -= 1
+                    m += 12
+                d = start._add_ymd(y, m, 0)._diff_in_days(end_date)
+            return int(y), int(m), int(d)
+
+        offsets = list(range(-64, 65)) + list(range(-1500, 1501, 53))
+        start = BusinessDate(20151201)
+        while start < BusinessDate(20170201):
+            for offset in offsets:
+                end = start._add_days(offset)
+                self.assertEqual(loop_diff_in_ymd(start, end), start.diff_in_ymd(end))
+            start = start._add_days(1 if start.day > 26 or start.day < 3 else 9)
+
     def test_from_businesperiod_str(self):
         self.assertEqual(BusinessDate() + '1B', BusinessDate('1B'))
         self.assertEqual(BusinessDate() + '1w', BusinessDate('1w'))
@@ -543,6 +958,56 @@ class BusinessDateUnitTests(unittest.TestCase):
         self.assertEqual((BusinessDate('20171231').adjust('mod_follow') + '3D').adjust('mod_follow'),
                          BusinessDate('0B3D0BMODFLW20171231'))
 
+    def test_date_expression(self):
+        expr = DateExpression.parse('0B3D2BMODFLW20171231')
+        self.assertTrue(expr is DateExpression.parse('0B3D2BMODFLW20171231'))
+        self.assertEqual((BusinessPeriod('0B'), BusinessPeriod('3D'), BusinessPeriod('2B'), 'modflw', '20171231'),
+                         (expr.spot, expr.period, expr.final, expr.convention, expr.origin))
+        target = (BusinessDate('20171231').adjust('mod_follow') + '3D').adjust('mod_follow') + '2B'
+        self.assertEqual(target, expr.evaluate())
+        self.assertEqual(target, BusinessDate('0B3D2BMODFLW20171231'))
+
+        expr = DateExpression.parse('1Y2M')
+        self.assertEqual((None, BusinessPeriod('1Y2M'), None, None, None),
+                         (expr.spot, expr.period, expr.final, expr.convention, expr.origin))
+        self.assertEqual(BusinessDate() + '1Y2M', expr.evaluate())
+        self.assertEqual(BusinessDate(20170115) + '1Y2M', expr.evaluate(20170115))
+
+        holidays = BusinessHolidays([date(2018, 1, 2)])
+        expr = DateExpression.parse('2B')
+        self.assertEqual(BusinessDate(20180103), expr.evaluate(BusinessDate(20171229)))
+        self.assertEqual(BusinessDate(20180103), expr.evaluate(BusinessDate(20171229), holidays))
+        self.assertEqual(BusinessDate(20180103), expr.evaluate(BusinessDate(20171229), holidays))
+        self.assertEqual(1, expr._memo.info()['hits'])
+        holidays.append(date(2018, 1, 3))
+        self.assertEqual(BusinessDate(20180104), expr.evaluate(BusinessDate(20171229), holidays))
+        self.assertEqual(BusinessDate(20180102), expr.evaluate(BusinessDate(20171229), []))
+
+        self.assertRaises(ValueError, DateExpression.parse, '0X3D')
+        self.assertRaises(ValueError, DateExpression.parse, '1YMODFLW20171399')
+
+        class MyDate(BusinessDate):
+            pass
+        self.assertEqual(MyDate, type(DateExpression.parse('1M20200101').evaluate(MyDate(20200101))))
+        self.assertEqual(BusinessDate, type(DateExpression.parse('1M20200101').evaluate(BusinessDate(20200101))))
+
+    def test_date_expression_units(self):
+        today = BusinessDate()
+        for long, short in (('2weeks', '2W'), ('10days', '10D'), ('3months', '3M'), ('1years', '1Y'),
+                            ('2quarters', '2Q'), ('1Y2months', '1Y2M'), ('1 years', '1Y')):
+            self.assertEqual(today + short, BusinessDate(long), long)
+        self.assertEqual(BusinessDate(20210101), BusinessDate('1years20200101'))
+        self.assertEqual(BusinessDate(20200103), BusinessDate('2businessdays20200101'))
+        self.assertEqual(BusinessDate(20200102), BusinessDate('0BMODFOLLOW20200101'))
+        self.assertEqual(today + 'ON', BusinessDate('ON'))
+        self.assertEqual(today + 'TN', BusinessDate('TN'))
+        self.assertEqual(BusinessDate(20200102), BusinessDate('ON20191231'))
+        self.assertEqual(BusinessDate(20200103), BusinessDate('TN20191231'))
+        self.assertEqual(BusinessDate(20200107), BusinessDate('tn20200103'))
+        self.assertEqual(today + 'ON', BusinessDate('ONFOLLOW'))
+        self.assertEqual(BusinessDate(20200102), BusinessDate('ONFOLLOW20191231'))
+        self.assertRaises(ValueError, DateExpression.parse, 'ON1D')
+
 
 class BusinessPeriodUnitTests(unittest.TestCase):
     def setUp(self):
@@ -704,6 +1169,28 @@ class BusinessPeriodUnitTests(unittest.TestCase):
         self.assertNotEqual(hash(BusinessPeriod('3D')), hash(BusinessPeriod('1D')))
         self.assertNotEqual(hash(BusinessPeriod('3D')), hash(BusinessPeriod('3B')))
 
+    def test_parse_cache(self):
+        cache = BusinessPeriod.PARSE_CACHE
+        maxsize = cache.maxsize
+        cache.clear()
+        self.assertEqual(cache.info(), dict(hits=0, misses=0, maxsize=maxsize, currsize=0))
+        for _ in range(3):
+            self.assertEqual(BusinessPeriod('3M'), BusinessPeriod(months=3))
+            self.assertEqual(BusinessPeriod('-1y2m'), BusinessPeriod(years=-1, months=-2))
+            self.assertRaises(ValueError, BusinessPeriod, '1Y-2W1D')
+        self.assertEqual(cache.info(), dict(hits=4, misses=5, maxsize=maxsize, currsize=2))
+        self.assertTrue(BusinessPeriod.is_businessperiod('3M'))
+
+        cache.resize(1)
+        self.assertEqual(len(cache), 1)
+        self.assertTrue('-1y2m' in cache)
+        cache.resize(0)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(BusinessPeriod('1D'), BusinessPeriod(days=1))
+        self.assertEqual(len(cache), 0)
+        cache.resize(maxsize)
+        cache.clear()
+
     def test_max_min_days(self):
         jan31 = BusinessDate(20010131)
         for date in BusinessRange(jan31, jan31 + '5y'):
@@ -717,6 +1204,14 @@ class BusinessPeriodUnitTests(unittest.TestCase):
         self.assertEqual(BusinessPeriod('-3m').min_days(), -90)
         self.assertEqual(BusinessPeriod('3m').max_days(), 92)
         self.assertEqual(BusinessPeriod('-3m').max_days(), -92)
+        self.assertEqual(BusinessPeriod('50y').min_days(), 18262)
+        self.assertEqual(BusinessPeriod('50y').max_days(), 18263)
+        self.assertEqual(BusinessPeriod('-50y').min_days(), -18262)
+        self.assertEqual(BusinessPeriod('-50y').max_days(), -18263)
+        self.assertEqual(BusinessPeriod('4y1m2d').min_days(), 1461 + 28 + 2)
+        self.assertEqual(BusinessPeriod('4y1m2d').max_days(), 1461 + 31 + 2)
+        self.assertEqual(BusinessPeriod('-4y1m2d').min_days(), -1461 - 28 - 2)
+        self.assertEqual(BusinessPeriod('-4y1m2d').max_days(), -1461 - 31 - 2)
 
     def test_cmp(self):
         self.assertFalse(BusinessPeriod('10b') < BusinessPeriod('9b'))
@@ -747,6 +1242,49 @@ class BusinessPeriodUnitTests(unittest.TestCase):
         self.assertFalse(BusinessPeriod('30D') == BusinessPeriod('1M'))
         self.assertFalse(BusinessPeriod('1D') == BusinessPeriod('1B'))
 
+        tenors = ['1D', '1W', '2W', '1M', '2M', '3M', '6M', '9M', '1Y', '18M', '2Y', '5Y', '10Y', '30Y', '50Y']
+        periods = [BusinessPeriod(t) for t in tenors]
+        self.assertEqual(periods, sorted(reversed(periods)))
+        self.assertEqual(periods[::-1], sorted(periods, reverse=True))
+        self.assertTrue(BusinessPeriod('1Y') <= '1Y')
+        self.assertTrue(BusinessPeriod('1Y') < '13M')
+
+    def test_immutable(self):
+        p = BusinessPeriod('3M')
+        self.assertRaises(AttributeError, setattr, p, '_months', 6)
+        self.assertRaises(AttributeError, setattr, p, 'foo', 6)
+        self.assertRaises(AttributeError, delattr, p, '_months')
+        self.assertFalse(hasattr(p, '__dict__'))
+        self.assertEqual(p, BusinessPeriod('3m'))
+
+        # interned tenors
+        self.assertTrue(BusinessPeriod('3M') is p)
+        self.assertTrue(BusinessPeriod(months=3) is p)
+        self.assertTrue(BusinessPeriod('1Q') is p)
+        self.assertTrue(BusinessPeriod(p) is p)
+        self.assertTrue(BusinessPeriod('ON') is BusinessPeriod('1B'))
+        self.assertFalse(BusinessPeriod('13D') is BusinessPeriod('13D'))
+        q = BusinessPeriod.intern('13D')
+        self.assertTrue(BusinessPeriod('13D') is q)
+        self.assertTrue(BusinessPeriod.intern(BusinessPeriod('13D')) is q)
+        del BusinessPeriod.INTERNED[(0, 13, 0)]
+
+        # structural hash
+        self.assertEqual(hash(BusinessPeriod('1Y')), hash(BusinessPeriod('12M')))
+        self.assertEqual(hash(BusinessPeriod('13D')), hash(BusinessPeriod(days=13)))
+        pillars = dict((BusinessPeriod(t), i) for i, t in enumerate(('1M', '3M', '6M', '1Y', '17D')))
+        self.assertEqual(pillars[BusinessPeriod('12M')], 3)
+        self.assertEqual(pillars[BusinessPeriod(days=17)], 4)
+        self.assertNotIn(BusinessPeriod('30D'), pillars)
+
+        # pickle and copy
+        for t in ('3M', '13D', '-2B', '-1Y2M3D'):
+            p = BusinessPeriod(t)
+            self.assertEqual(pickle.loads(pickle.dumps(p)), p)
+            self.assertEqual(copy(p), p)
+            self.assertEqual(deepcopy(p), p)
+        self.assertTrue(pickle.loads(pickle.dumps(BusinessPeriod('3M'))) is BusinessPeriod('3M'))
+
 
 class BusinessRangeUnitTests(unittest.TestCase):
     def setUp(self):
@@ -801,6 +1339,43 @@ class BusinessRangeUnitTests(unittest.TestCase):
             self.assertEqual(bs.adjust(k), BusinessDate(list(map(v, bs, h))))
         BusinessDate.BASE_DATE = date.today()
 
+    def test_grid(self):
+        self.assertRaises(ValueError, BusinessRange, self.sd, self.ed, '0D')
+        self.assertRaises(ValueError, BusinessRange, self.sd, self.ed, '0B')
+        for step in ('1D', '1W', '1M3D', '-1M', '3M', '1Y', '1B', '2B', '5B', '-1B'):
+            for roll in (self.sd - '5y', self.sd + '1m', self.ed + '7d', BusinessDate(20170531), BusinessDate(20170603)):
+                br = BusinessRange(self.sd, self.ed, step, roll)
+                self.assertEqual(_grid(self.sd, self.ed, step, roll), br)
+                self.assertEqual(sorted(set(br)), br)
+
+    def test_lazy(self):
+        for step, roll in (('1D', 20000101), ('1M', self.sd - '1y'), ('-1M3D', 20170531), ('3B', self.ed)):
+            br = BusinessRange(self.sd, self.ed, step, roll)
+            lr = LazyBusinessRange(self.sd, self.ed, step, roll)
+            self.assertEqual(len(br), len(lr))
+            self.assertEqual(br, list(lr))
+            self.assertEqual(br[-1], lr[-1])
+            self.assertEqual(br[5:50:3], list(lr[5:50:3]))
+            self.assertEqual(br[::-1], list(reversed(lr)))
+            self.assertEqual(br[::-2], list(lr[::-2]))
+            for d in (br[0], br[7], br[-1], self.sd - '1d', self.ed, self.sd + '3d'):
+                self.assertEqual(d in br, d in lr)
+                self.assertEqual(d in br[::-3], d in lr[::-3])
+                if d in br:
+                    self.assertEqual(br.index(d), lr.index(d))
+
+            ba = BusinessRange(self.sd, self.ed, step, roll).adjust('mod_follow')
+            la = lr.adjust('mod_follow')
+            self.assertEqual(ba, list(la))
+            self.assertEqual(br, list(lr))
+            for d in (ba[0], ba[9], ba[-1], self.sd - '1d', self.sd + '1y'):
+                self.assertEqual(d in ba, d in la)
+                self.assertEqual(d in ba[::-1], d in la[::-1])
+                if d in ba:
+                    self.assertEqual(ba.index(d), la.index(d))
+        self.assertEqual(0, len(LazyBusinessRange(self.ed, self.sd)))
+        self.assertRaises(ValueError, LazyBusinessRange(self.sd, self.ed).index, self.ed)
+
 
 class BusinessScheduleUnitTests(unittest.TestCase):
     def setUp(self):
@@ -845,6 +1420,36 @@ class BusinessScheduleUnitTests(unittest.TestCase):
         ck = BusinessSchedule(20151231, 20160630, '-1M', 20160331)
         self.assertEqual(bs, ck)
 
+    def test_business_days_step(self):
+        # schedule on business day steps compared to stepping rolling + step * i
+        for step, roll in (('1B', None), ('5B', 20160102), ('-2B', 20170101), ('3B', 20151225)):
+            bs = BusinessSchedule(self.sd, self.sd + '1y', step, roll)
+            roll = BusinessDate(roll) if roll else self.sd + '1y'
+            ck = _grid(self.sd, self.sd + '1y', step, roll)
+            ck = ck if ck[0] == self.sd else [self.sd] + ck
+            ck = ck if ck[-1] == self.sd + '1y' else ck + [self.sd + '1y']
+            self.assertEqual(ck, bs)
+
+    def test_cash_flow_schedule(self):
+        holidays = TargetHolidays()
+        for stubs in ((False, False), (True, False), (False, True), (True, True)):
+            for step, roll, lag in (('3M', None, 0), ('6M', 20160415, 2), ('1Y', 20151115, -1), ('10B', None, 1)):
+                cf = CashFlowSchedule(self.sd, self.ed, step, roll, *stubs, convention='mod_follow',
+                                      day_count='act_360', holidays=holidays, payment_lag=lag)
+                bs = BusinessSchedule(self.sd, self.ed, step, roll)
+                bs = bs.first_stub_long() if stubs[0] else bs
+                bs = bs.last_stub_long() if stubs[1] else bs
+                ad = [d.adjust('mod_follow', holidays) for d in bs]
+                self.assertEqual(tuple(bs), cf.unadjusted_dates)
+                self.assertEqual(tuple(ad), cf.adjusted_dates)
+                self.assertEqual(len(bs) - 1, len(cf))
+                for (s, e, p, yf), a, b in zip(cf, ad[:-1], ad[1:]):
+                    self.assertEqual((a, b, b + ('%dB' % lag), a.get_day_count(b, 'act_360')), (s, e, p, yf))
+
+        cf = CashFlowSchedule(self.sd, self.sd, '1Y')
+        self.assertEqual(0, len(cf))
+        self.assertEqual((self.sd,), cf.unadjusted_dates)
+
     def test_methods(self):
         bs = BusinessSchedule(20150331, 20160930, '3M', 20160415).first_stub_long()
         ck = BusinessDate([20150331, 20150715, 20151015, 20160115, 20160415, 20160715, 20160930])
@@ -867,6 +1472,175 @@ class BusinessHolidayUnitTests(unittest.TestCase):
             self.assertTrue(BusinessDate(l).to_date() in h)
         self.assertNotEqual(self.bd.add_period('3b', h), self.bd.add_period('3b'))
 
+    def test_modification(self):
+        h = BusinessHolidays(self.list[:2])
+        bd = BusinessDate(20150301)
+        self.assertFalse(bd in h)
+        h.append(bd)
+        self.assertTrue(bd in h)
+        self.assertTrue(bd.to_date() in h)
+        self.assertTrue(BaseDateFloat.from_date(bd) in h)
+        h.remove(bd)
+        self.assertFalse(bd in h)
+        h.extend([bd, bd])
+        h.remove(bd)
+        self.assertTrue(bd in h)
+        del h[-1]
+        self.assertFalse(bd in h)
+        h += [bd]
+        self.assertTrue(bd in h)
+        self.assertTrue(bd.to_date() == h.pop())
+        self.assertFalse(bd in h)
+        h[0] = bd
+        self.assertTrue(bd in h)
+        self.assertFalse(self.list[0] in h)
+        h.insert(0, self.list[0])
+        self.assertTrue(self.list[0] in h)
+        del h[:1]
+        self.assertFalse(self.list[0] in h)
+        h[:1] = [self.list[0]]
+        self.assertTrue(self.list[0] in h)
+        self.assertFalse(bd in h)
+        h[1:1] = [bd]
+        self.assertTrue(bd in h)
+        h.clear()
+        self.assertFalse(bd in h)
+        self.assertEqual(len(h), 0)
+
+    def test_business_day_index(self):
+        h = BusinessHolidays(self.list)
+        h.INDEX_YEARS = 1975, 1985
+        index = h.business_day_index()
+        self.assertTrue(index is h.business_day_index())
+        # plain list avoids the index
+        l = list(h)
+        start, end = BusinessDate(19741215), BusinessDate(19860115)
+        for d in BusinessRange(start, end, '3d'):
+            if d.toordinal() in index:
+                self.assertEqual(d.is_business_day(h), index.is_business_day(d.toordinal()))
+            for n in (-25, -3, -1, 0, 1, 2, 7, 30):
+                self.assertEqual(d._add_business_days(n, h), d._add_business_days(n, l), (d, n))
+            for c in ('follow', 'previous', 'mod_follow', 'mod_previous', 'eom', 'som'):
+                self.assertEqual(d.adjust(c, h), d.adjust(c, l), (d, c))
+            e = d + '17d'
+            self.assertEqual(d.diff_in_business_days(e, h), d.diff_in_business_days(e, l))
+            self.assertEqual(e.diff_in_business_days(d, h), e.diff_in_business_days(d, l))
+            self.assertEqual(d._add_business_days(d.diff_in_business_days(e, h), h), e.adjust('previous', h))
+
+        h.append(BusinessDate(19800303))
+        self.assertFalse(index is h.business_day_index())
+        self.assertFalse(h.business_day_index().is_business_day(BusinessDate(19800303).toordinal()))
+
+    def test_lazy_business_day_index(self):
+        h = BusinessHolidays(self.list)
+        h.INDEX_DAYS = 10
+        d = BusinessDate(20160101)
+        # one-off calculations walk day by day
+        self.assertEqual(d.add_period('2B', h), d.add_period('2B', list(h)))
+        self.assertEqual(d.adjust('follow', h), d.adjust('follow', list(h)))
+        self.assertTrue(h._index is None)
+        # index is built once enough days have been walked
+        self.assertEqual(d.diff_in_business_days(d + '1M', h), d.diff_in_business_days(d + '1M', list(h)))
+        self.assertFalse(h._index is None)
+        self.assertEqual(d.add_period('2B', h), d.add_period('2B', list(h)))
+        # and dropped (incl. walked days) on modification
+        h.append(BusinessDate(20160104))
+        self.assertTrue(h._index is None)
+        self.assertEqual(BusinessDate(20160105), d.add_period('1B', h))
+        self.assertTrue(h._index is None)
+        self.assertTrue(h.business_day_index() is h.business_day_index(1))
+
+
+@unittest.skipIf(np is None, 'requires numpy')
+class BusinessDateArrayUnitTests(unittest.TestCase):
+    def setUp(self):
+        self.dates = list(BusinessRange(BusinessDate(19000101), BusinessDate(19000401), '1d'))
+        self.dates += list(BusinessRange(BusinessDate(20151120), BusinessDate(20160410), '1d'))
+        self.dates += list(BusinessRange(BusinessDate(19750101), BusinessDate(20990101), '97d'))
+        self.array = BusinessDateArray(self.dates)
+
+    def test_constructors(self):
+        self.assertEqual(self.array.to_list(), self.dates)
+        self.assertEqual(list(self.array), self.dates)
+        self.assertEqual(self.array[5], self.dates[5])
+        self.assertEqual(self.array[-3:].to_list(), self.dates[-3:])
+        self.assertEqual(len(self.array), len(self.dates))
+
+        excel = self.array.to_excel()
+        self.assertEqual(list(excel), [int(d.to_float()) for d in self.dates])
+        self.assertTrue(BusinessDateArray(excel).to_excel() is excel)
+        self.assertEqual(BusinessDateArray([d.to_date() for d in self.dates]), self.array)
+        self.assertEqual(BusinessDateArray(self.array.to_datetime64()), self.array)
+        self.assertEqual(BusinessDateArray.from_ymd(*self.array.to_ymd()), self.array)
+        self.assertEqual(BusinessDateArray([20160101, '20160102']), BusinessDate([20160101, 20160102]))
+
+    def test_calculations(self):
+        for p in ('1d', '-1d', '1m', '-1m', '1y1m1d', '-1y6m', '3b', '-3b', '0b', '1w'):
+            self.assertEqual(self.array.add_period(p).to_list(), [d.add_period(p) for d in self.dates], p)
+        end = BusinessDate(20200229)
+        self.assertEqual(list(self.array.diff_in_days(end)), [d.diff_in_days(end) for d in self.dates])
+        self.assertEqual(self.array.end_of_month().to_list(), [d.end_of_month() for d in self.dates])
+        self.assertEqual(list(self.array.is_business_day()), [d.is_business_day() for d in self.dates])
+
+    def test_adjust(self):
+        holidays = BusinessHolidays(self.dates[::7])
+        for c in BusinessDate._adj_func:
+            self.assertEqual(self.array.adjust(c).to_list(), [d.adjust(c) for d in self.dates], c)
+            res = self.array.adjust(c, holidays).to_list()
+            self.assertEqual(res, [d.adjust(c, holidays) for d in self.dates], c)
+            # plain list runs scalar fallback
+            self.assertEqual(self.array.adjust(c, list(holidays)).to_list(), res, c)
+
+    def test_day_count(self):
+        end = self.array.add_period('1y3m')
+        for c in BusinessDate._dc_func:
+            res = self.array.get_day_count(end, c)
+            self.assertEqual(list(res), [d.get_day_count(e, c) for d, e in zip(self.dates, end)], c)
+
+
+class InstrumentationUnitTests(unittest.TestCase):
+    def test_stats(self):
+        adjust, new = _BusinessDate.__dict__['adjust'], BusinessPeriod.__dict__['__new__']
+        self.assertFalse(stats()['enabled'])
+        instrumentation.reset()
+        BusinessDate(20160102).adjust('follow', [])
+        self.assertEqual({}, stats()['timers'])
+        self.assertEqual(0, stats()['counters']['adjust day steps'])
+
+        instrumentation.enable()
+        try:
+            holidays = BusinessHolidays([BusinessDate(20160104)])
+            self.assertEqual(BusinessDate(20160105), BusinessDate(20160102).adjust('follow', [BusinessDate(20160104)]))
+            self.assertEqual(BusinessDate(20160105), BusinessDate(20160101).add_period('1B', [BusinessDate(20160104)]))
+            self.assertTrue(BusinessDate(20160104) in holidays)
+            self.assertFalse(BusinessDate(20160105) in holidays)
+            BusinessPeriod('4711D')
+            BusinessDate('0B17D1BFOLLOW20160101')
+            figures = stats()
+        finally:
+            instrumentation.disable()
+
+        self.assertTrue(figures['enabled'])
+        self.assertFalse(stats()['enabled'])
+        counters = figures['counters']
+        self.assertEqual(3, counters['adjust day steps'])
+        self.assertEqual(4, counters['business day steps'])
+        self.assertTrue(2 <= counters['holiday checks'])
+        self.assertEqual(1, counters['expression parses'])
+        self.assertTrue(1 <= counters['period parses'])
+        timers = figures['timers']
+        self.assertTrue(1 <= timers['BusinessDate.adjust']['calls'])
+        self.assertTrue(1 <= timers['BusinessDate.add_period']['calls'])
+        self.assertEqual(1, timers['DateExpression.evaluate']['calls'])
+        self.assertTrue(0. < timers['BusinessDate.__new__']['seconds'])
+        self.assertIn('BusinessPeriod.PARSE_CACHE', figures['caches'])
+
+        # disable restores the original methods
+        self.assertTrue(_BusinessDate.__dict__['adjust'] is adjust)
+        self.assertTrue(BusinessPeriod.__dict__['__new__'] is new)
+        instrumentation.reset()
+        self.assertEqual({}, stats()['timers'])
+
 
 class OldDateUnitTests(unittest.TestCase):
     def test_diff(self):